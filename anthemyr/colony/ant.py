@@ -27,16 +27,19 @@ Key movement model:
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass, field
+from collections.abc import Iterator, MutableMapping
+from dataclasses import InitVar, dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from numpy.random import Generator
 
     from anthemyr.colony.traits import Traits
     from anthemyr.pheromones.fields import PheromoneField
-    from anthemyr.world.cell import Cell
+    from anthemyr.world.cell import CellView
     from anthemyr.world.world import World
 
 # -- Constants ---------------------------------------------------------------
@@ -54,6 +57,23 @@ _TRAIL_DEPOSIT_AT_FOOD = 5.0
 _RECRUITMENT_DEPOSIT = 3.0
 _TRAIL_DEPOSIT_PER_STEP = 2.0
 _FOOD_PICKUP = 3.0
+_DEFAULT_THRESHOLD = 0.5
+
+# Stimulus name -> Ant attribute holding that response threshold
+_THRESHOLD_FIELDS = {
+    "food": "threshold_food",
+    "alarm": "threshold_alarm",
+    "brood": "threshold_brood",
+    "waste": "threshold_waste",
+}
+
+# Direction of each single-cell step (dx, dy), as math.atan2(dy, dx)
+_STEP_ANGLE = {
+    (dx, dy): math.atan2(dy, dx)
+    for dx in (-1, 0, 1)
+    for dy in (-1, 0, 1)
+    if dx != 0 or dy != 0
+}
 
 
 class Task(Enum):
@@ -69,10 +89,87 @@ class Task(Enum):
     WASTE_MANAGEMENT = auto()
 
 
-@dataclass
+class _Thresholds(MutableMapping[str, float]):
+    """Dict-style view of an ant's threshold attributes.
+
+    Reads and writes go straight to the ``threshold_*`` fields.  The key
+    set is fixed, so deleting a key raises ``TypeError``.
+    """
+
+    __slots__ = ("_ant",)
+
+    def __init__(self, ant: Ant) -> None:
+        self._ant = ant
+
+    def __getitem__(self, key: str) -> float:
+        return getattr(self._ant, _THRESHOLD_FIELDS[key])
+
+    def __setitem__(self, key: str, value: float) -> None:
+        setattr(self._ant, _THRESHOLD_FIELDS[key], value)
+
+    def __delitem__(self, key: str) -> None:
+        msg = "ant thresholds cannot be removed"
+        raise TypeError(msg)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_THRESHOLD_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_THRESHOLD_FIELDS)
+
+
+# Ant state in constructor order, for __repr__ / __eq__
+_STATE = (
+    "x",
+    "y",
+    "task",
+    "hp",
+    "age",
+    "carrying_food",
+    "heading",
+    "_lay_trail",
+    "_gather_patience",
+    "_forage_ticks",
+    *_THRESHOLD_FIELDS.values(),
+)
+
+# One record per ant for the state that colony-wide passes operate on
+ANT_DTYPE = np.dtype([("hp", np.float64), ("age", np.int64)])
+
+
+class AntColumns:
+    """Per-ant numeric state stored as one ``ANT_DTYPE`` record per ant.
+
+    Colony-wide passes (aging, food pressure, culling the dead) run as
+    single NumPy operations over the field views.
+
+    Attributes:
+        records: Structured ``ANT_DTYPE`` array, one row per ant.
+        hp: View of the ``hp`` field of ``records``.
+        age: View of the ``age`` field of ``records``.
+    """
+
+    __slots__ = ("age", "hp", "records")
+
+    def __init__(self, records: np.ndarray) -> None:
+        """Wrap an existing ``ANT_DTYPE`` array."""
+        self.set_records(records)
+
+    def set_records(self, records: np.ndarray) -> None:
+        """Replace the backing array and refresh the field views."""
+        self.records = records
+        self.hp = records["hp"]
+        self.age = records["age"]
+
+
+@dataclass(slots=True, init=False)
 class Ant:
     """A single ant agent.
 
+    ``hp`` and ``age`` live in an ``AntColumns`` row rather than on the
+    ant itself.  A new ant owns a one-row store; adding it to an
+    ``AntPopulation`` moves its row into the population's columns.
+
     Attributes:
         x: Current column position in the world grid.
         y: Current row position in the world grid.
@@ -82,8 +179,11 @@ class Ant:
         carrying_food: Amount of food currently carried.
         heading: Current movement direction in radians (0 = east,
             pi/2 = south).  Used for correlated random walk.
-        thresholds: Per-stimulus response thresholds.  Lower values mean
-            the ant is more likely to respond to that stimulus.
+        threshold_food: Response threshold for foraging stimuli.  Lower
+            values mean the ant is more likely to respond.
+        threshold_alarm: Response threshold for alarm stimuli.
+        threshold_brood: Response threshold for brood-care stimuli.
+        threshold_waste: Response threshold for waste stimuli.
         _lay_trail: Whether to deposit trail while carrying/gathering.
         _gather_patience: Ticks remaining before a gatherer gives up
             and reverts to scouting from its current position.
@@ -94,15 +194,89 @@ class Ant:
 
     x: int
     y: int
-    task: Task = Task.IDLE
-    hp: float = 1.0
-    age: int = 0
-    carrying_food: float = 0.0
-    heading: float = 0.0
-    _lay_trail: bool = False
-    _gather_patience: int = _GATHER_PATIENCE_MAX
-    _forage_ticks: int = 0
-    thresholds: dict[str, float] = field(default_factory=dict)
+    task: Task
+    # Init-only so dataclasses.replace() carries them over; the values
+    # themselves live in the row behind the ``hp`` / ``age`` properties.
+    hp: InitVar[float]
+    age: InitVar[int]
+    carrying_food: float
+    heading: float
+    _lay_trail: bool
+    _gather_patience: int
+    _forage_ticks: int
+    threshold_food: float
+    threshold_alarm: float
+    threshold_brood: float
+    threshold_waste: float
+    _columns: AntColumns = field(init=False, repr=False, compare=False)
+    _row: int = field(init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        task: Task = Task.IDLE,
+        hp: float = 1.0,
+        age: int = 0,
+        carrying_food: float = 0.0,
+        heading: float = 0.0,
+        _lay_trail: bool = False,
+        _gather_patience: int = _GATHER_PATIENCE_MAX,
+        _forage_ticks: int = 0,
+        threshold_food: float = _DEFAULT_THRESHOLD,
+        threshold_alarm: float = _DEFAULT_THRESHOLD,
+        threshold_brood: float = _DEFAULT_THRESHOLD,
+        threshold_waste: float = _DEFAULT_THRESHOLD,
+    ) -> None:
+        """Create a free-standing ant holding its own hp/age row."""
+        self.x = x
+        self.y = y
+        self.task = task
+        self.carrying_food = carrying_food
+        self.heading = heading
+        self._lay_trail = _lay_trail
+        self._gather_patience = _gather_patience
+        self._forage_ticks = _forage_ticks
+        self.threshold_food = threshold_food
+        self.threshold_alarm = threshold_alarm
+        self.threshold_brood = threshold_brood
+        self.threshold_waste = threshold_waste
+        self._columns = AntColumns(np.array([(hp, age)], dtype=ANT_DTYPE))
+        self._row = 0
+
+    def __repr__(self) -> str:
+        """Show the constructor arguments, ``hp`` and ``age`` included."""
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in _STATE)
+        return f"Ant({args})"
+
+    def __eq__(self, other: object) -> bool:
+        """Compare ants by state, ``hp`` and ``age`` included."""
+        if not isinstance(other, Ant):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _STATE)
+
+    @property
+    def hp(self) -> float:
+        """Hit-points / vitality (dies at 0)."""
+        return float(self._columns.hp[self._row])
+
+    @hp.setter
+    def hp(self, value: float) -> None:
+        self._columns.hp[self._row] = value
+
+    @property
+    def age(self) -> int:
+        """Ticks since birth."""
+        return int(self._columns.age[self._row])
+
+    @age.setter
+    def age(self, value: int) -> None:
+        self._columns.age[self._row] = value
+
+    @property
+    def thresholds(self) -> MutableMapping[str, float]:
+        """Thresholds keyed by stimulus name, backed by the fields."""
+        return _Thresholds(self)
 
     @property
     def is_alive(self) -> bool:
@@ -133,12 +307,10 @@ class Ant:
         """
         mean = traits.foraging_threshold_mean
         var = traits.threshold_variance
-        thresholds = {
-            "food": float(rng.normal(mean, var)),
-            "alarm": float(rng.normal(traits.alarm_threshold_mean, var)),
-            "brood": float(rng.normal(traits.brood_care_threshold_mean, var)),
-            "waste": float(rng.normal(traits.waste_threshold_mean, var)),
-        }
+        threshold_food = float(rng.normal(mean, var))
+        threshold_alarm = float(rng.normal(traits.alarm_threshold_mean, var))
+        threshold_brood = float(rng.normal(traits.brood_care_threshold_mean, var))
+        threshold_waste = float(rng.normal(traits.waste_threshold_mean, var))
         hp = float(rng.uniform(0.8, 1.2))
         heading = float(rng.uniform(0.0, 2.0 * math.pi))
         return cls(
@@ -147,7 +319,10 @@ class Ant:
             task=Task.FORAGING,
             hp=hp,
             heading=heading,
-            thresholds=thresholds,
+            threshold_food=threshold_food,
+            threshold_alarm=threshold_alarm,
+            threshold_brood=threshold_brood,
+            threshold_waste=threshold_waste,
         )
 
     def update(
@@ -172,7 +347,6 @@ class Ant:
         """
         from anthemyr.pheromones.fields import PheromoneType
 
-        self.age += 1
         food_deposited = 0.0
 
         match self.task:
@@ -238,7 +412,7 @@ class Ant:
             self.y,
         )
         if recruitment > 0:
-            threshold = self.thresholds.get("food", 0.5)
+            threshold = self.threshold_food
             # Sigmoid-like response: strong signal + low threshold = likely
             prob = recruitment / (recruitment + threshold)
             if rng.random() < prob:
@@ -248,7 +422,7 @@ class Ant:
                 return
 
         stimulus = float(rng.random())
-        threshold = self.thresholds.get("food", 0.5)
+        threshold = self.threshold_food
         if stimulus > threshold:
             self.task = Task.FORAGING
 
@@ -287,8 +461,7 @@ class Ant:
             is_motherlode = remaining_before >= _MOTHERLODE_THRESHOLD
             is_dense_cluster = self._is_in_food_cluster(world, self.x, self.y)
 
-            pickup = min(cell.food, _FOOD_PICKUP)
-            cell.food -= pickup
+            pickup = world.take_food(self.x, self.y, _FOOD_PICKUP)
             self.carrying_food = pickup
             self.task = Task.CARRYING_FOOD
             self._forage_ticks = 0  # reset: we found food
@@ -326,7 +499,7 @@ class Ant:
             self.y,
         )
         if recruitment > 0:
-            threshold = self.thresholds.get("food", 0.5)
+            threshold = self.threshold_food
             # Urgency ramps up: after 30 ticks of fruitless search the
             # ant is twice as susceptible, after 60 ticks three times.
             urgency = 1.0 + self._forage_ticks / 30.0
@@ -440,8 +613,7 @@ class Ant:
 
             if is_motherlode or is_dense_cluster:
                 # Worth picking up -- commit to carrying
-                pickup = min(cell.food, _FOOD_PICKUP)
-                cell.food -= pickup
+                pickup = world.take_food(self.x, self.y, _FOOD_PICKUP)
                 self.carrying_food = pickup
                 self.task = Task.CARRYING_FOOD
                 self._gather_patience = _GATHER_PATIENCE_MAX
@@ -505,7 +677,7 @@ class Ant:
            farther from the nest.
         2. Otherwise, fall back to a correlated random walk.
         """
-        neighbours = world.neighbours(self.x, self.y)
+        neighbours = world.neighbours8(self.x, self.y)
         if not neighbours:
             return
 
@@ -548,7 +720,7 @@ class Ant:
         """
         from anthemyr.pheromones.fields import PheromoneType
 
-        neighbours = world.neighbours(self.x, self.y)
+        neighbours = world.neighbours8(self.x, self.y)
         if not neighbours:
             return
 
@@ -584,23 +756,23 @@ class Ant:
         """
         from anthemyr.pheromones.fields import PheromoneType
 
-        neighbours = world.neighbours(self.x, self.y)
+        neighbours = world.neighbours8(self.x, self.y)
         if not neighbours:
             return
 
         # Noisy heading: current heading + Gaussian noise
         noisy = self.heading + float(rng.normal(0.0, _HEADING_NOISE_STD))
 
-        best_cell: Cell | None = None
+        territory_grid = pheromones.get_layer(PheromoneType.TERRITORY)
+        x, y = self.x, self.y
+        best_cell: CellView | None = None
         best_score = -999.0
         for cell in neighbours:
-            dx = cell.x - self.x
-            dy = cell.y - self.y
-            angle = math.atan2(dy, dx)
+            angle = _STEP_ANGLE[cell.x - x, cell.y - y]
             # Heading alignment: 1.0 when perfectly aligned, -1.0 opposite
             alignment = math.cos(angle - noisy)
             # Territory penalty: prefer unexplored cells
-            territory = pheromones.read(PheromoneType.TERRITORY, cell.x, cell.y)
+            territory = territory_grid.item(cell.y, cell.x)
             score = alignment - territory
             if score > best_score:
                 best_score = score
@@ -609,7 +781,7 @@ class Ant:
         if best_cell is not None:
             self._step_to(best_cell)
 
-    def _step_to(self, cell: Cell) -> None:
+    def _step_to(self, cell: CellView) -> None:
         """Move to a cell and update heading to match the step direction."""
         dx = cell.x - self.x
         dy = cell.y - self.y
@@ -625,12 +797,13 @@ class Ant:
         rng: Generator,
     ) -> None:
         """Move one step toward a target with slight randomness."""
-        neighbours = world.neighbours(self.x, self.y)
+        neighbours = world.neighbours8(self.x, self.y)
         if not neighbours:
             return
 
         # Sort by Manhattan distance to target, pick from best few
-        neighbours.sort(
+        neighbours = sorted(
+            neighbours,
             key=lambda c: abs(c.x - target_x) + abs(c.y - target_y),
         )
         # Pick from the closest 1-2 neighbours for faster returns
@@ -653,23 +826,19 @@ class Ant:
         Returns:
             True if this cell is part of a cluster, False otherwise.
         """
-        neighbours = world.neighbours(x, y)
-        # Count cells with food, including current cell
-        food_count = 1 if world.cell_at(x, y).food > 0 else 0
-        for cell in neighbours:
-            if cell.food > 0:
-                food_count += 1
+        # Count cells with food in the 3x3 block, including current cell
+        food_count = int((world.food_window(x, y) > 0).sum())
         return food_count >= 3
 
     def _best_directional_trail(
         self,
-        neighbours: list[Cell],
+        neighbours: tuple[CellView, ...],
         pheromones: PheromoneField,
         nest_x: int,
         nest_y: int,
         *,
         toward_nest: bool,
-    ) -> Cell | None:
+    ) -> CellView | None:
         """Pick the best trail-following neighbour with directional bias.
 
         Real ants can determine trail polarity — they don't just walk
@@ -699,12 +868,13 @@ class Ant:
         my_dist = abs(self.x - nest_x) + abs(self.y - nest_y)
 
         for ptype in (PheromoneType.TRAIL, PheromoneType.RECRUITMENT):
-            best_cell: Cell | None = None
+            grid = pheromones.get_layer(ptype)
+            best_cell: CellView | None = None
             best_score = -999.0
             has_pheromone = False
 
             for cell in neighbours:
-                val = pheromones.read(ptype, cell.x, cell.y)
+                val = float(grid[cell.y, cell.x])
                 if val <= 0:
                     continue
                 has_pheromone = True
@@ -729,10 +899,10 @@ class Ant:
 
     @staticmethod
     def _best_pheromone_neighbour(
-        neighbours: list[Cell],
+        neighbours: tuple[CellView, ...],
         pheromones: PheromoneField,
         ptype: object,
-    ) -> Cell | None:
+    ) -> CellView | None:
         """Return the neighbour with the highest pheromone of the given type.
 
         Returns None if all neighbours have zero concentration.
@@ -742,10 +912,11 @@ class Ant:
         if not isinstance(ptype, PheromoneType):
             return None
 
-        best_cell: Cell | None = None
+        grid = pheromones.get_layer(ptype)
+        best_cell: CellView | None = None
         best_val = 0.0
         for cell in neighbours:
-            val = pheromones.read(ptype, cell.x, cell.y)
+            val = float(grid[cell.y, cell.x])
             if val > best_val:
                 best_val = val
                 best_cell = cell
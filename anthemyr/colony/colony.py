@@ -14,8 +14,12 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from numpy.random import Generator
 
+    from anthemyr.pheromones.fields import PheromoneField
+    from anthemyr.world.world import World
+
 from anthemyr.colony.ant import Ant
 from anthemyr.colony.policies import Policies
+from anthemyr.colony.population import AntPopulation
 from anthemyr.colony.traits import Traits
 
 
@@ -32,7 +36,9 @@ class Colony:
         brood_progress: Ticks accumulated toward next brood maturation.
         traits: Genetic trait profile for this colony.
         policies: Current policy-slider settings.
-        ants: Living ant population.
+        ants: Living ant population; its ``hp`` / ``age`` columns back
+            the colony-wide passes.  Any iterable of ants passed in is
+            adopted into a new ``AntPopulation``.
         generation: Generational counter for evolutionary tracking.
     """
 
@@ -44,9 +50,14 @@ class Colony:
     brood_progress: int = 0
     traits: Traits = field(default_factory=Traits)
     policies: Policies = field(default_factory=Policies)
-    ants: list[Ant] = field(default_factory=list)
+    ants: AntPopulation = field(default_factory=AntPopulation)
     generation: int = 0
 
+    def __post_init__(self) -> None:
+        """Adopt a plain iterable of ants into an ``AntPopulation``."""
+        if not isinstance(self.ants, AntPopulation):
+            self.ants = AntPopulation(self.ants)
+
     def spawn_ant(self, rng: Generator) -> Ant:
         """Create a new ant at the nest with trait-derived thresholds.
 
@@ -65,6 +76,34 @@ class Colony:
         self.ants.append(ant)
         return ant
 
+    def update_ants(
+        self,
+        world: World,
+        pheromones: PheromoneField,
+        rng: Generator,
+    ) -> float:
+        """Run one tick of local decision-making for every ant.
+
+        Every ant ages by one tick.  Food that ants bring back to the
+        nest is added to ``food_stores``.
+
+        Args:
+            world: The world grid for spatial queries.
+            pheromones: Multi-layer pheromone field for reading/depositing.
+            rng: Seeded random generator.
+
+        Returns:
+            Total food delivered to the nest this tick.
+        """
+        nest_x, nest_y = self.nest_x, self.nest_y
+        delivered = 0.0
+        self.ants.age += 1
+        for ant in self.ants:
+            food = ant.update(world, pheromones, nest_x, nest_y, rng)
+            self.food_stores += food
+            delivered += food
+        return delivered
+
     def consume_food(self, amount_per_ant: float = 0.1) -> None:
         """Deduct per-tick food consumption for all living ants.
 
@@ -105,8 +144,7 @@ class Colony:
         ratio = food_per_ant / comfort_food_per_ant
         damage = max_damage * (1.0 - ratio)
 
-        for ant in self.ants:
-            ant.hp -= damage
+        self.ants.hp -= damage
 
     def apply_aging(self, max_age: int) -> None:
         """Kill ants that have exceeded their maximum lifespan.
@@ -114,9 +152,8 @@ class Colony:
         Args:
             max_age: Age in ticks after which an ant dies.
         """
-        for ant in self.ants:
-            if ant.age >= max_age:
-                ant.hp = 0.0
+        ants = self.ants
+        ants.hp[ants.age >= max_age] = 0.0
 
     def lay_eggs(
         self,
@@ -204,12 +241,14 @@ class Colony:
             return 0
 
         self.brood_progress += self.brood_count
-        hatched = 0
-        while self.brood_progress >= mature_ticks and self.brood_count > 0:
-            self.brood_progress -= mature_ticks
-            self.brood_count -= 1
+        if mature_ticks > 0:
+            hatched = min(self.brood_progress // mature_ticks, self.brood_count)
+        else:
+            hatched = self.brood_count
+        self.brood_progress -= hatched * mature_ticks
+        self.brood_count -= hatched
+        for _ in range(hatched):
             self.spawn_ant(rng)
-            hatched += 1
         return hatched
 
     def remove_dead(self) -> list[Ant]:
@@ -218,6 +257,4 @@ class Colony:
         Returns:
             List of ants that were removed.
         """
-        dead = [a for a in self.ants if not a.is_alive]
-        self.ants = [a for a in self.ants if a.is_alive]
-        return dead
+        return self.ants.remove_dead()
@@ -0,0 +1,137 @@
+"""AntPopulation — a colony's ants with their vitals stored column-wise.
+
+The population is an ordered sequence of ``Ant`` objects, and also the
+``AntColumns`` store behind their ``hp`` and ``age``.  Per-ant decision
+logic still runs through the ``Ant`` objects, while colony-wide passes
+operate on the ``hp`` / ``age`` arrays directly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, overload
+
+import numpy as np
+
+from anthemyr.colony.ant import ANT_DTYPE, AntColumns
+
+if TYPE_CHECKING:
+    from anthemyr.colony.ant import Ant
+
+# Records allocated up front; the buffer doubles whenever it fills
+_INITIAL_CAPACITY = 64
+
+
+class AntPopulation(AntColumns, Sequence["Ant"]):
+    """Ordered ants of one colony; row ``i`` of ``records`` is ``self[i]``.
+
+    Records live in a preallocated buffer that grows geometrically, so
+    spawning an ant is amortised O(1).
+
+    Attributes:
+        records: ``ANT_DTYPE`` array, one record per ant; a view of the
+            leading rows of the buffer.
+        hp: Hit-points, one entry per ant.
+        age: Age in ticks, one entry per ant.
+    """
+
+    __slots__ = ("_ants", "_buffer")
+
+    def __init__(self, ants: Iterable[Ant] = ()) -> None:
+        """Create a population, adopting ``ants`` in order."""
+        self._buffer = np.zeros(_INITIAL_CAPACITY, dtype=ANT_DTYPE)
+        super().__init__(self._buffer[:0])
+        self._ants: list[Ant] = []
+        for ant in ants:
+            self.append(ant)
+
+    def __len__(self) -> int:
+        """Number of ants in the population."""
+        return len(self._ants)
+
+    def __iter__(self) -> Iterator[Ant]:
+        """Iterate over ants in row order."""
+        return iter(self._ants)
+
+    @overload
+    def __getitem__(self, index: int) -> Ant: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Ant]: ...
+
+    def __getitem__(self, index: int | slice) -> Ant | list[Ant]:
+        """Return the ant (or list of ants) at ``index``."""
+        return self._ants[index]
+
+    def __repr__(self) -> str:
+        """Show the ants in row order."""
+        return f"AntPopulation({self._ants!r})"
+
+    def positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Gather every ant's position into column arrays.
+
+        Positions live on the ``Ant`` objects, where the per-ant movement
+        code reads and writes them far more cheaply than it could through
+        array elements; this collects them for whole-population work.
+
+        Returns:
+            ``(xs, ys)`` int32 arrays in row order.
+        """
+        n = len(self._ants)
+        xs = np.fromiter((ant.x for ant in self._ants), dtype=np.int32, count=n)
+        ys = np.fromiter((ant.y for ant in self._ants), dtype=np.int32, count=n)
+        return xs, ys
+
+    def append(self, ant: Ant) -> None:
+        """Add ``ant`` as the last row, moving its record into ``records``.
+
+        Args:
+            ant: An ant not currently in any population.
+
+        Raises:
+            ValueError: If ``ant`` already belongs to a population.
+        """
+        if isinstance(ant._columns, AntPopulation):
+            msg = "ant already belongs to a population"
+            raise ValueError(msg)
+        n = len(self._ants)
+        if n == len(self._buffer):
+            grown = np.zeros(2 * n, dtype=ANT_DTYPE)
+            grown[:n] = self._buffer
+            self._buffer = grown
+        self._buffer[n] = ant._columns.records[ant._row]
+        self.set_records(self._buffer[: n + 1])
+        ant._columns = self
+        ant._row = len(self._ants)
+        self._ants.append(ant)
+
+    def remove_dead(self) -> list[Ant]:
+        """Remove ants with ``hp <= 0`` and compact the columns.
+
+        Removed ants get their own one-row store back, so they keep
+        reporting their final hp and age.
+
+        Returns:
+            The removed ants, in row order.
+        """
+        alive = self.hp > 0
+        if alive.all():
+            return []
+
+        dead: list[Ant] = []
+        survivors: list[Ant] = []
+        for ant, is_alive in zip(self._ants, alive.tolist(), strict=True):
+            if is_alive:
+                ant._row = len(survivors)
+                survivors.append(ant)
+            else:
+                row = ant._row
+                ant._columns = AntColumns(self.records[row : row + 1].copy())
+                ant._row = 0
+                dead.append(ant)
+
+        kept = len(survivors)
+        self._buffer[:kept] = self.records[alive]
+        self.set_records(self._buffer[:kept])
+        self._ants = survivors
+        return dead
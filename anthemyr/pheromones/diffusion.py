@@ -8,6 +8,7 @@ swapped or optimised independently.
 from __future__ import annotations
 
 from anthemyr.pheromones.fields import PheromoneField, PheromoneLayer
+from anthemyr.pheromones.kernels import evaporate_diffuse, zero_faint
 
 
 def evaporate(layer: PheromoneLayer) -> None:
@@ -37,10 +38,11 @@ def diffuse(layer: PheromoneLayer) -> None:
         return
 
     grid = layer.grid
-    donated = grid * rate
+    # Each neighbour's cut of the donated amount.  rate / 4 is exact, so
+    # this matches (grid * rate) / 4 without the extra temporary.
+    share = grid * (rate / 4.0)
     grid *= 1.0 - rate  # keep the non-donated portion
 
-    share = donated / 4.0
     # Shift in each cardinal direction and accumulate
     grid[1:, :] += share[:-1, :]  # donate downward
     grid[:-1, :] += share[1:, :]  # donate upward
@@ -56,7 +58,10 @@ def update_field(field: PheromoneField) -> None:
     This preserves the linear trail shape that carrying ants deposit,
     creating clear directional signals rather than noisy blobs.
 
-    All other pheromone types receive both evaporation and diffusion.
+    All other pheromone types receive both evaporation and diffusion,
+    fused into one kernel per layer.  Vanishingly faint concentrations
+    are then zeroed so they never decay into slow subnormal floats; that
+    sweep runs once over the whole layer stack rather than per layer.
 
     Args:
         field: The complete pheromone field to update.
@@ -64,6 +69,12 @@ def update_field(field: PheromoneField) -> None:
     from anthemyr.pheromones.fields import PheromoneType
 
     for layer in field.layers.values():
-        evaporate(layer)
-        if layer.ptype is not PheromoneType.TRAIL:
-            diffuse(layer)
+        if layer.ptype is PheromoneType.TRAIL:
+            evaporate(layer)
+        else:
+            evaporate_diffuse(
+                layer.grid,
+                layer.evaporation_rate,
+                layer.diffusion_rate,
+            )
+    zero_faint(field.grid)
@@ -1,18 +1,24 @@
 """PheromoneField — multi-layer pheromone grid.
 
-Each pheromone type (trail, alarm, territory, etc.) is stored as a
-separate NumPy 2D array.  The field provides deposit/read operations and
-delegates diffusion/evaporation to ``diffusion.py``.
+Each pheromone type (trail, alarm, territory, etc.) has its own 2D layer.
+The layers are views into one contiguous ``(types, height, width)`` array,
+so whole-field passes can treat every type at once.  The field provides
+deposit/read operations and delegates diffusion/evaporation to
+``diffusion.py``.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from typing import TYPE_CHECKING
 
 import numpy as np
 from numpy.typing import NDArray
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class PheromoneType(Enum):
     """Distinct pheromone channels, each with its own layer."""
@@ -26,19 +32,26 @@ class PheromoneType(Enum):
     ROYAL = auto()
 
 
+# Position of each type's layer along the first axis of PheromoneField.grid
+LAYER_INDEX: dict[PheromoneType, int] = {
+    ptype: i for i, ptype in enumerate(PheromoneType)
+}
+
+
 @dataclass
 class PheromoneLayer:
     """A single pheromone channel stored as a 2D NumPy array.
 
     Attributes:
         ptype: Which pheromone this layer represents.
-        grid: Concentration values (≥ 0).
+        grid: Concentration values (≥ 0); float32 inside a
+            ``PheromoneField``.
         diffusion_rate: Fraction that spreads to neighbours per tick.
         evaporation_rate: Fraction lost per tick (before diffusion).
     """
 
     ptype: PheromoneType
-    grid: NDArray[np.float64]
+    grid: NDArray[np.float32]
     diffusion_rate: float = 0.1
     evaporation_rate: float = 0.05
 
@@ -50,21 +63,27 @@ class PheromoneField:
     Attributes:
         width: Grid columns (must match World).
         height: Grid rows (must match World).
-        layers: Mapping from PheromoneType to its layer.
+        grid: Every layer stacked as ``(types, height, width)``, in
+            ``LAYER_INDEX`` order.
+        layers: Mapping from PheromoneType to its layer; each layer's
+            grid is a view into ``grid``.
     """
 
     width: int
     height: int
+    grid: NDArray[np.float32] = field(init=False, repr=False)
     layers: dict[PheromoneType, PheromoneLayer] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Create one layer per pheromone type, all zeroed."""
-        self.layers = {}
-        for ptype in PheromoneType:
-            self.layers[ptype] = PheromoneLayer(
-                ptype=ptype,
-                grid=np.zeros((self.height, self.width), dtype=np.float64),
-            )
+        self.grid = np.zeros(
+            (len(LAYER_INDEX), self.height, self.width),
+            dtype=np.float32,
+        )
+        self.layers = {
+            ptype: PheromoneLayer(ptype=ptype, grid=self.grid[i])
+            for ptype, i in LAYER_INDEX.items()
+        }
 
     def deposit(self, ptype: PheromoneType, x: int, y: int, amount: float) -> None:
         """Add pheromone at a specific cell.
@@ -77,6 +96,26 @@ class PheromoneField:
         """
         self.layers[ptype].grid[y, x] += amount
 
+    def deposit_many(
+        self,
+        ptype: PheromoneType,
+        xs: Sequence[int],
+        ys: Sequence[int],
+        amount: float,
+    ) -> None:
+        """Add ``amount`` of pheromone at each ``(xs[i], ys[i])``.
+
+        Repeated coordinates accumulate, exactly as repeated ``deposit``
+        calls would.
+
+        Args:
+            ptype: Which pheromone to deposit.
+            xs: Column indices.
+            ys: Row indices, same length as ``xs``.
+            amount: Quantity to add at each position (must be ≥ 0).
+        """
+        np.add.at(self.layers[ptype].grid, (ys, xs), amount)
+
     def read(self, ptype: PheromoneType, x: int, y: int) -> float:
         """Read pheromone concentration at a cell.
 
@@ -90,7 +129,7 @@ class PheromoneField:
         """
         return float(self.layers[ptype].grid[y, x])
 
-    def get_layer(self, ptype: PheromoneType) -> NDArray[np.float64]:
+    def get_layer(self, ptype: PheromoneType) -> NDArray[np.float32]:
         """Return the raw NumPy array for a pheromone layer.
 
         Args:
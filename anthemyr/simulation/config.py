@@ -7,21 +7,37 @@ This keeps the simulation core data-driven and easy to experiment with.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same results, faster
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
-@dataclass
+# Parsed configs by resolved path, with the (mtime_ns, size) they were read at
+_YAML_CACHE: OrderedDict[Path, tuple[int, int, SimulationConfig]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+
+
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """Top-level simulation configuration.
 
+    Instances are immutable and hashable; use ``dataclasses.replace`` to
+    derive a variant.  ``pheromone_defaults`` takes part in equality but
+    not in the hash, since dicts are unhashable.
+
     Attributes:
         seed: RNG seed for deterministic replay.
         world_width: Number of grid columns.
         world_height: Number of grid rows.
         day_length: Ticks per full day/night cycle.
+        weather_enabled: Whether the stochastic rain model runs.
         initial_ants: Starting ant population per colony.
         max_age: Maximum ant lifespan in ticks before death.
         comfort_food_per_ant: Food-per-ant level at which health
@@ -43,6 +59,7 @@ class SimulationConfig:
     world_width: int = 64
     world_height: int = 64
     day_length: int = 100
+    weather_enabled: bool = True
     initial_ants: int = 50
 
     # Ant lifecycle
@@ -60,12 +77,19 @@ class SimulationConfig:
     egg_rate: float = 0.5
     brood_mature_ticks: int = 40
 
-    pheromone_defaults: dict[str, dict[str, float]] = field(default_factory=dict)
+    pheromone_defaults: dict[str, dict[str, float]] = field(
+        default_factory=dict,
+        hash=False,
+    )
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> SimulationConfig:
         """Load configuration from a YAML file.
 
+        Parsed files are cached by path, modification time, and size, so
+        reloading an unchanged file skips the read and the parse.  Each
+        call still returns a fresh instance.
+
         Args:
             path: Path to the YAML config file.
 
@@ -75,42 +99,69 @@ class SimulationConfig:
         Raises:
             FileNotFoundError: If the config file does not exist.
         """
-        path = Path(path)
+        path = Path(path).resolve()
+        st = path.stat()
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _YAML_CACHE.move_to_end(path)
+            return cached[2].copy()
+
+        cfg = cls._parse_yaml(path)
+        _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, cfg)
+        if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+        return cfg.copy()
+
+    def copy(self) -> SimulationConfig:
+        """Return an independent copy, including the pheromone overrides."""
+        return replace(
+            self,
+            pheromone_defaults={
+                name: dict(rates) for name, rates in self.pheromone_defaults.items()
+            },
+        )
+
+    @classmethod
+    def _parse_yaml(cls, path: Path) -> SimulationConfig:
+        """Read and parse ``path`` into a new instance, bypassing the cache."""
         with path.open("r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_SafeLoader) or {}
 
+        # Slotted dataclasses keep no class-level defaults; read them here
+        defaults = cls()
         return cls(
-            seed=data.get("seed", cls.seed),
-            world_width=data.get("world_width", cls.world_width),
-            world_height=data.get("world_height", cls.world_height),
-            day_length=data.get("day_length", cls.day_length),
-            initial_ants=data.get("initial_ants", cls.initial_ants),
-            max_age=data.get("max_age", cls.max_age),
+            seed=data.get("seed", defaults.seed),
+            world_width=data.get("world_width", defaults.world_width),
+            world_height=data.get("world_height", defaults.world_height),
+            day_length=data.get("day_length", defaults.day_length),
+            weather_enabled=data.get("weather_enabled", defaults.weather_enabled),
+            initial_ants=data.get("initial_ants", defaults.initial_ants),
+            max_age=data.get("max_age", defaults.max_age),
             comfort_food_per_ant=data.get(
                 "comfort_food_per_ant",
-                cls.comfort_food_per_ant,
+                defaults.comfort_food_per_ant,
             ),
             max_starvation_damage=data.get(
                 "max_starvation_damage",
-                cls.max_starvation_damage,
+                defaults.max_starvation_damage,
             ),
             consumption_per_ant=data.get(
                 "consumption_per_ant",
-                cls.consumption_per_ant,
+                defaults.consumption_per_ant,
             ),
             base_regen_rate=data.get(
                 "base_regen_rate",
-                cls.base_regen_rate,
+                defaults.base_regen_rate,
             ),
             spread_regen_rate=data.get(
                 "spread_regen_rate",
-                cls.spread_regen_rate,
+                defaults.spread_regen_rate,
             ),
-            food_cap=data.get("food_cap", cls.food_cap),
-            egg_rate=data.get("egg_rate", cls.egg_rate),
+            food_cap=data.get("food_cap", defaults.food_cap),
+            egg_rate=data.get("egg_rate", defaults.egg_rate),
             brood_mature_ticks=data.get(
                 "brood_mature_ticks",
-                cls.brood_mature_ticks,
+                defaults.brood_mature_ticks,
             ),
             pheromone_defaults=data.get("pheromone_defaults", {}),
         )
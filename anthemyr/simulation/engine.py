@@ -13,6 +13,7 @@ tick order defined in the design spec:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Any
 
 import numpy as np
 from numpy.random import Generator
@@ -55,7 +56,10 @@ class SimulationEngine:
             height=self.config.world_height,
         )
         self.world.populate(self.rng)
-        self.environment = Environment(day_length=self.config.day_length)
+        self.environment = Environment(
+            day_length=self.config.day_length,
+            weather_enabled=self.config.weather_enabled,
+        )
         self.pheromone_field = PheromoneField(
             width=self.config.world_width,
             height=self.config.world_height,
@@ -101,15 +105,7 @@ class SimulationEngine:
 
         # 3. Update ants
         for colony in self.colonies:
-            for ant in colony.ants:
-                food = ant.update(
-                    self.world,
-                    self.pheromone_field,
-                    colony.nest_x,
-                    colony.nest_y,
-                    self.rng,
-                )
-                colony.food_stores += food
+            colony.update_ants(self.world, self.pheromone_field, self.rng)
 
         # 4. Resolve conflicts
         self._resolve_conflicts()
@@ -125,11 +121,11 @@ class SimulationEngine:
 
             # Deposit DEATH pheromone at corpse sites before removing
             dead = colony.remove_dead()
-            for ant in dead:
-                self.pheromone_field.deposit(
+            if dead:
+                self.pheromone_field.deposit_many(
                     PheromoneType.DEATH,
-                    ant.x,
-                    ant.y,
+                    [ant.x for ant in dead],
+                    [ant.y for ant in dead],
                     5.0,
                 )
 
@@ -155,6 +151,26 @@ class SimulationEngine:
         for _ in range(ticks):
             self.step()
 
+    def snapshot_rng(self) -> dict[str, Any]:
+        """Capture the master RNG's exact position in its stream.
+
+        Returns:
+            A snapshot for ``restore_rng``; it does not change as the
+            engine keeps drawing.
+        """
+        return {"bit_generator": self.rng.bit_generator.state}
+
+    def restore_rng(self, snapshot: dict[str, Any]) -> None:
+        """Rewind or fast-forward the master RNG to a saved position.
+
+        Only the random stream is restored; world, pheromone, and colony
+        state are left as they are.
+
+        Args:
+            snapshot: A value returned by ``snapshot_rng``.
+        """
+        self.rng.bit_generator.state = snapshot["bit_generator"]
+
     def _resolve_conflicts(self) -> None:
         """Handle combat, deaths, and disease across all colonies.
 
@@ -3,10 +3,17 @@
 Renders the world grid, food, pheromone trails, and ants in a window.
 The simulation steps at a configurable tick rate while the display
 refreshes at the Pygame frame rate.
+
+The grid layers (nest, trail, food) are composed with NumPy on a worker
+thread into one of two pre-allocated surfaces while the main thread shows
+the other, so composition overlaps the next simulation step.  Event
+handling, ants, the info panel and ``display.flip`` stay on the main
+thread, as SDL requires.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING, ClassVar
 
 import numpy as np
@@ -43,6 +50,42 @@ _FOOD_HI = np.array([50, 200, 30], dtype=np.float64)
 _TRAIL_COLOUR = np.array([0, 180, 255], dtype=np.float64)
 
 
+def _compose_grid(
+    food: np.ndarray,
+    nest: np.ndarray,
+    trail: np.ndarray,
+) -> np.ndarray:
+    """Composite nest, trail, and food into one RGB image, one pixel per cell.
+
+    Layers are applied in draw order: background and nest, then the
+    translucent trail overlay (alpha 0-120, scaled to the strongest
+    trail cell), then opaque food shaded by amount.
+
+    Args:
+        food: ``(H, W)`` food per cell.
+        nest: ``(H, W)`` nest membership.
+        trail: ``(H, W)`` TRAIL pheromone concentration.
+
+    Returns:
+        ``(H, W, 3)`` uint8 image.
+    """
+    rgb = np.empty((*food.shape, 3), dtype=np.float64)
+    rgb[...] = _BG
+    rgb[nest] = _NEST
+
+    max_val = trail.max()
+    if max_val > 0:
+        alpha = (np.clip(trail / max_val, 0.0, 1.0) * 120).astype(np.uint8)
+        alpha[trail <= 0.01] = 0
+        a = alpha[..., np.newaxis] / 255.0
+        rgb = rgb * (1.0 - a) + _TRAIL_COLOUR * a
+
+    has_food = food > 0
+    t = np.minimum(food[has_food] / 5.0, 1.0)[:, np.newaxis]
+    rgb[has_food] = (_FOOD_LO + t * (_FOOD_HI - _FOOD_LO)).astype(int)
+    return rgb.astype(np.uint8)
+
+
 class PygameRenderer:
     """Renders a SimulationEngine state into a Pygame window.
 
@@ -93,6 +136,14 @@ class PygameRenderer:
         pygame.display.set_caption("Anthemyr")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("monospace", 14)
+
+        # Double-buffered grid frames: the worker fills one while the
+        # main thread blits the other.
+        self._frames = [pygame.Surface((w, h)), pygame.Surface((w, h))]
+        self._front = 0
+        self._pending: Future[None] | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
         self.running = True
         self.paused = False
 
@@ -109,21 +160,30 @@ class PygameRenderer:
     def run(self, fps: int = 30) -> None:
         """Main loop: handle events, step sim, render.
 
+        The worker is drained and pygame shut down even if a step or a
+        draw raises, so no frame is still being written during teardown.
+
         Args:
             fps: Target frames per second.
         """
-        while self.running:
-            dt = self.clock.tick(fps) / 1000.0  # seconds elapsed
-            self._handle_events()
-            if not self.paused:
-                self._tick_accumulator += self.ticks_per_second * dt
-                steps = int(self._tick_accumulator)
-                self._tick_accumulator -= steps
-                for _ in range(steps):
-                    self.engine.step()
-            self._draw()
-
-        pygame.quit()
+        try:
+            while self.running:
+                dt = self.clock.tick(fps) / 1000.0  # seconds elapsed
+                self._handle_events()
+                if not self.paused:
+                    self._tick_accumulator += self.ticks_per_second * dt
+                    steps = int(self._tick_accumulator)
+                    self._tick_accumulator -= steps
+                    for _ in range(steps):
+                        self.engine.step()
+                self._draw()
+        finally:
+            if self._pending is not None:
+                # Wait without re-raising, so a worker error cannot mask
+                # the exception that ended the loop.
+                wait([self._pending])
+            self._executor.shutdown(wait=True)
+            pygame.quit()
 
     def _handle_events(self) -> None:
         """Process Pygame input events."""
@@ -146,71 +206,53 @@ class PygameRenderer:
                     self.ticks_per_second = self._SPEED_STEPS[self._speed_index]
 
     def _draw(self) -> None:
-        """Render one frame."""
+        """Render one frame.
+
+        Shows the grid frame composed in the background since the last
+        call, then queues composition of the current state into the
+        other buffer.
+        """
+        if self._pending is None:
+            self._compose(self._frames[self._front], *self._snapshot())
+        else:
+            self._pending.result()
+            self._front = 1 - self._front
+
         self.screen.fill(_BG)
-        self._draw_terrain()
-        self._draw_trail_overlay()
-        self._draw_food()
+        self.screen.blit(self._frames[self._front], (0, 0))
         self._draw_ants()
         self._draw_info_panel()
         pygame.display.flip()
 
-    def _draw_terrain(self) -> None:
-        """Draw nest cells as a distinct colour."""
-        cs = self.cell_size
-        world = self.engine.world
-        for y in range(world.height):
-            for x in range(world.width):
-                cell = world.cells[y][x]
-                if cell.is_nest:
-                    pygame.draw.rect(
-                        self.screen,
-                        _NEST,
-                        (x * cs, y * cs, cs, cs),
-                    )
+        self._pending = self._executor.submit(
+            self._compose,
+            self._frames[1 - self._front],
+            *self._snapshot(),
+        )
 
-    def _draw_food(self) -> None:
-        """Draw food as green squares scaled by amount."""
-        cs = self.cell_size
+    def _snapshot(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Copy the grid state the worker needs, so the sim can keep stepping."""
         world = self.engine.world
-        for y in range(world.height):
-            for x in range(world.width):
-                food = world.cells[y][x].food
-                if food > 0:
-                    t = min(food / 5.0, 1.0)
-                    colour = _FOOD_LO + t * (_FOOD_HI - _FOOD_LO)
-                    pygame.draw.rect(
-                        self.screen,
-                        colour.astype(int).tolist(),
-                        (x * cs, y * cs, cs, cs),
-                    )
-
-    def _draw_trail_overlay(self) -> None:
-        """Draw trail pheromone as a translucent cyan overlay."""
-        cs = self.cell_size
         trail = self.engine.pheromone_field.get_layer(PheromoneType.TRAIL)
-        max_val = trail.max()
-        if max_val <= 0:
-            return
+        return world.food.copy(), world.is_nest.copy(), trail.copy()
 
-        overlay = pygame.Surface(
-            (self.engine.world.width * cs, self.engine.world.height * cs),
-            pygame.SRCALPHA,
-        )
-
-        for y in range(trail.shape[0]):
-            for x in range(trail.shape[1]):
-                val = trail[y, x]
-                if val > 0.01:
-                    alpha = int(min(val / max_val, 1.0) * 120)
-                    colour = _TRAIL_COLOUR.astype(int).tolist()
-                    pygame.draw.rect(
-                        overlay,
-                        (*colour, alpha),
-                        (x * cs, y * cs, cs, cs),
-                    )
+    def _compose(
+        self,
+        surface: pygame.Surface,
+        food: np.ndarray,
+        nest: np.ndarray,
+        trail: np.ndarray,
+    ) -> None:
+        """Compose the grid layers and upscale them into ``surface``.
 
-        self.screen.blit(overlay, (0, 0))
+        Runs on the worker thread; only touches NumPy arrays and the
+        back buffer, which the main thread is not blitting.
+        """
+        cs = self.cell_size
+        rgb = _compose_grid(food, nest, trail)
+        # surfarray is indexed [x, y]
+        pixels = rgb.transpose(1, 0, 2).repeat(cs, axis=0).repeat(cs, axis=1)
+        pygame.surfarray.blit_array(surface, pixels)
 
     def _draw_ants(self) -> None:
         """Draw each ant as a small coloured dot."""
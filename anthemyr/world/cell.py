@@ -3,26 +3,45 @@
 Each cell holds terrain properties and local resource levels.  Pheromone
 concentrations are stored externally in ``PheromoneField`` layers so the
 cell itself stays lightweight.
+
+The World stores cell properties as parallel NumPy arrays (one per
+attribute).  ``Cell`` is a plain value object holding the defaults, and
+``CellView`` is the live per-tile handle that ``World.cell_at`` returns:
+it reads and writes the world's arrays in place.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from anthemyr.world.world import World
 
 
-class SoilType(Enum):
-    """Soil composition affecting digging speed and moisture retention."""
+class SoilType(IntEnum):
+    """Soil composition affecting digging speed and moisture retention.
+
+    Values are the uint8 codes ``World.soil`` stores.
+    """
 
-    DIRT = "dirt"
-    SAND = "sand"
-    CLAY = "clay"
-    ROCK = "rock"
+    DIRT = 0
+    SAND = 1
+    CLAY = 2
+    ROCK = 3
 
 
-@dataclass
+# SoilType members by code, for fast lookups from World.soil
+SOIL_TYPES: tuple[SoilType, ...] = tuple(SoilType)
+
+
+@dataclass(slots=True)
 class Cell:
-    """A single tile in the world grid.
+    """Values for a single tile, detached from any world.
+
+    The field defaults are also the initial values of every tile in a
+    new ``World``.
 
     Attributes:
         x: Column position.
@@ -41,3 +60,76 @@ class Cell:
     temperature: float = 0.5
     food: float = 0.0
     is_nest: bool = False
+
+
+class CellView:
+    """Live view of one World tile, backed by the world's arrays.
+
+    Exposes the same attributes as ``Cell``; reads and writes go straight
+    to the corresponding ``World`` array at ``[y, x]``.
+
+    Attributes:
+        x: Column position.
+        y: Row position.
+    """
+
+    __slots__ = ("_world", "x", "y")
+
+    def __init__(self, world: World, x: int, y: int) -> None:
+        """Bind the view to ``world`` at ``(x, y)``."""
+        self._world = world
+        self.x = x
+        self.y = y
+
+    def __repr__(self) -> str:
+        """Show position and the current cell values."""
+        return (
+            f"CellView(x={self.x}, y={self.y}, soil={self.soil!r}, "
+            f"moisture={self.moisture}, temperature={self.temperature}, "
+            f"food={self.food}, is_nest={self.is_nest})"
+        )
+
+    @property
+    def soil(self) -> SoilType:
+        """Soil type at this location."""
+        return SOIL_TYPES[self._world.soil[self.y, self.x]]
+
+    @soil.setter
+    def soil(self, value: SoilType) -> None:
+        self._world.soil[self.y, self.x] = value
+
+    @property
+    def moisture(self) -> float:
+        """Moisture level (0.0-1.0)."""
+        return float(self._world.moisture[self.y, self.x])
+
+    @moisture.setter
+    def moisture(self, value: float) -> None:
+        self._world.moisture[self.y, self.x] = value
+
+    @property
+    def temperature(self) -> float:
+        """Local temperature in arbitrary sim-units."""
+        return float(self._world.temperature[self.y, self.x])
+
+    @temperature.setter
+    def temperature(self, value: float) -> None:
+        self._world.temperature[self.y, self.x] = value
+
+    @property
+    def food(self) -> float:
+        """Amount of harvestable food at this cell."""
+        return float(self._world.food[self.y, self.x])
+
+    @food.setter
+    def food(self, value: float) -> None:
+        self._world.food[self.y, self.x] = value
+
+    @property
+    def is_nest(self) -> bool:
+        """Whether this cell is part of a colony nest."""
+        return bool(self._world.is_nest[self.y, self.x])
+
+    @is_nest.setter
+    def is_nest(self, value: bool) -> None:
+        self._world.is_nest[self.y, self.x] = value
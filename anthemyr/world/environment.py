@@ -24,12 +24,16 @@ class Environment:
         time_of_day: Normalised time (0.0 = midnight, 0.5 = noon).
         rain_intensity: Current rain level (0.0-1.0).
         day_length: Number of ticks in a full day/night cycle.
+        weather_enabled: Whether the stochastic rain model runs.  When
+            False no new rain starts and no weather randomness is drawn;
+            rain already falling still tapers off.
     """
 
     tick: int = 0
     time_of_day: float = 0.0
     rain_intensity: float = 0.0
     day_length: int = 100
+    weather_enabled: bool = True
 
     @property
     def is_daytime(self) -> bool:
@@ -49,7 +53,7 @@ class Environment:
         self.time_of_day = (self.tick % self.day_length) / self.day_length
 
         # Simple stochastic rain model — replace with config-driven weather later
-        if rng.random() < 0.01:
+        if self.weather_enabled and rng.random() < 0.01:
             self.rain_intensity = float(rng.uniform(0.2, 1.0))
         elif self.rain_intensity > 0:
             self.rain_intensity = max(0.0, self.rain_intensity - 0.05)
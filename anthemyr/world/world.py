@@ -7,36 +7,244 @@ diffusion, and environment updates.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from numpy.random import Generator
 
-from anthemyr.world.cell import Cell
+from anthemyr.world.cell import Cell, CellView, SoilType
+
+# Neighbour offsets as (dx, dy): 4 cardinal first, then 4 diagonal.
+_OFFSETS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_OFFSETS_8 = (*_OFFSETS_4, (-1, -1), (-1, 1), (1, -1), (1, 1))
+# The same offsets as index-typed column arrays, for batched index gathers
+_DX_8 = np.array([dx for dx, _ in _OFFSETS_8], dtype=np.intp)
+_DY_8 = np.array([dy for _, dy in _OFFSETS_8], dtype=np.intp)
+
+# Initial values for every tile
+_DEFAULT_CELL = Cell(x=0, y=0)
+
+# Width of the zero-food border kept around the food grid.  Two cells covers
+# the regen stencil, so neighbourhood reads never need a bounds test.
+_HALO = 2
+
+# regenerate_food neighbourhood: (dx, dy, weight) for the 24 cells of the
+# 5x5 block around a cell.  Inner ring (8-connected) weighs 1.0, outer 0.5.
+_REGEN_STENCIL = tuple(
+    (dx, dy, 1.0 if abs(dx) <= 1 and abs(dy) <= 1 else 0.5)
+    for dy in range(-2, 3)
+    for dx in range(-2, 3)
+    if dx != 0 or dy != 0
+)
+
+
+def _ring_weighted_sum(padded: np.ndarray) -> np.ndarray:
+    """Sum each cell's 5x5 neighbourhood with ring weights.
+
+    ``padded`` carries a ``_HALO``-wide zero border, so cells outside the
+    grid contribute nothing.  Terms are accumulated in ``_REGEN_STENCIL``
+    order, one shifted slice at a time.
+    """
+    h = padded.shape[0] - 2 * _HALO
+    w = padded.shape[1] - 2 * _HALO
+    total = np.zeros((h, w), dtype=np.float64)
+    for dx, dy, weight in _REGEN_STENCIL:
+        ys = _HALO + dy
+        xs = _HALO + dx
+        total += padded[ys : ys + h, xs : xs + w] * weight
+    return total
+
+
+@functools.lru_cache(maxsize=16)
+def _circle_kernel(radius: int) -> np.ndarray:
+    """Return the circular food falloff kernel for a patch radius.
+
+    Cells near the centre weigh close to 1, cells beyond ``radius`` weigh
+    0.  The array is cached and shared, so it is marked read-only.
+    """
+    dx, dy = np.meshgrid(
+        np.arange(-radius, radius + 1),
+        np.arange(-radius, radius + 1),
+    )
+    dist = np.hypot(dx, dy)
+    kernel = np.where(dist <= radius, 1.0 - dist / (radius + 1), 0.0)
+    kernel.flags.writeable = False
+    return kernel
 
 
 @dataclass
 class World:
     """A 2D grid world that contains all spatial simulation state.
 
+    Per-cell state is stored structure-of-arrays: one ``(height, width)``
+    NumPy array per attribute, indexed ``[y, x]``.  Whole-grid passes
+    operate on these arrays directly; ``cell_at`` / ``cells`` hand out
+    ``CellView`` handles for per-tile access.
+
     Attributes:
         width: Number of columns in the grid.
         height: Number of rows in the grid.
-        cells: 2D list of Cell objects indexed as ``cells[y][x]``.
+        food: Harvestable food per cell (float32).  A view into a buffer
+            with a zero-food halo; assign into it rather than rebinding it.
+        is_nest: Whether each cell is part of a colony nest.
+        soil: Soil type per cell, as ``SoilType`` codes (uint8).
+        moisture: Moisture level per cell (0.0-1.0, float32).
+        temperature: Local temperature per cell in arbitrary sim-units
+            (float32).
     """
 
     width: int
     height: int
-    cells: list[list[Cell]] = field(init=False, repr=False)
+    food: np.ndarray = field(init=False, repr=False)
+    is_nest: np.ndarray = field(init=False, repr=False)
+    soil: np.ndarray = field(init=False, repr=False)
+    moisture: np.ndarray = field(init=False, repr=False)
+    temperature: np.ndarray = field(init=False, repr=False)
+    _food_padded: np.ndarray = field(init=False, repr=False)
+    _ring_weight: np.ndarray = field(init=False, repr=False)
+    _views: list[CellView] | None = field(init=False, repr=False, default=None)
+    _rows: list[list[CellView]] | None = field(
+        init=False,
+        repr=False,
+        default=None,
+    )
+    _nbr4: list[tuple[CellView, ...]] | None = field(
+        init=False,
+        repr=False,
+        default=None,
+    )
+    _nbr8: list[tuple[CellView, ...]] | None = field(
+        init=False,
+        repr=False,
+        default=None,
+    )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare worlds by size and per-cell state."""
+        if not isinstance(other, World):
+            return NotImplemented
+        return (
+            self.width == other.width
+            and self.height == other.height
+            and np.array_equal(self.food, other.food)
+            and np.array_equal(self.is_nest, other.is_nest)
+            and np.array_equal(self.soil, other.soil)
+            and np.array_equal(self.moisture, other.moisture)
+            and np.array_equal(self.temperature, other.temperature)
+        )
 
     def __post_init__(self) -> None:
-        """Initialise the grid with default cells."""
-        self.cells = [
-            [Cell(x=x, y=y) for x in range(self.width)] for y in range(self.height)
-        ]
+        """Allocate the per-cell arrays filled with default cell values."""
+        shape = (self.height, self.width)
+        padded_shape = (self.height + 2 * _HALO, self.width + 2 * _HALO)
+        interior = (slice(_HALO, -_HALO), slice(_HALO, -_HALO))
+        self._food_padded = np.zeros(padded_shape, dtype=np.float32)
+        self.food = self._food_padded[interior]
+        self.is_nest = np.empty(shape, dtype=np.bool_)
+        self.soil = np.empty(shape, dtype=np.uint8)
+        self.moisture = np.empty(shape, dtype=np.float32)
+        self.temperature = np.empty(shape, dtype=np.float32)
+        self.reset()
+        # Total in-bounds regen weight per cell; depends only on the shape
+        ones = np.zeros(padded_shape)
+        ones[interior] = 1.0
+        self._ring_weight = _ring_weighted_sum(ones)
+
+    def reset(self) -> None:
+        """Restore every cell to default values, reusing the arrays.
+
+        Existing array references and CellView handles stay valid.
+        """
+        self.food.fill(_DEFAULT_CELL.food)
+        self.is_nest.fill(_DEFAULT_CELL.is_nest)
+        self.soil.fill(_DEFAULT_CELL.soil)
+        self.moisture.fill(_DEFAULT_CELL.moisture)
+        self.temperature.fill(_DEFAULT_CELL.temperature)
+
+    @property
+    def flat_cells(self) -> list[CellView]:
+        """Row-major list of CellView handles, indexed ``[y * width + x]``.
+
+        Built on first access and reused afterwards.
+        """
+        if self._views is None:
+            self._views = [
+                CellView(self, x, y)
+                for y in range(self.height)
+                for x in range(self.width)
+            ]
+        return self._views
+
+    @property
+    def cells(self) -> list[list[CellView]]:
+        """2D list of CellView handles indexed as ``cells[y][x]``.
+
+        Each row holds the same handles as ``flat_cells``.
+        """
+        if self._rows is None:
+            flat = self.flat_cells
+            w = self.width
+            self._rows = [flat[i : i + w] for i in range(0, len(flat), w)]
+        return self._rows
+
+    def soil_mask(self, soil_type: SoilType) -> np.ndarray:
+        """Return a boolean ``(height, width)`` mask of cells with ``soil_type``.
+
+        Args:
+            soil_type: Soil type to select.
+        """
+        return self.soil == int(soil_type)
+
+    def take_food(self, x: int, y: int, amount: float) -> float:
+        """Remove up to ``amount`` food from a cell.
+
+        Args:
+            x: Column index.
+            y: Row index.
+            amount: Maximum food to remove.
+
+        Returns:
+            The food actually removed (limited by what the cell holds).
+        """
+        taken = min(float(self.food[y, x]), amount)
+        self.food[y, x] -= taken
+        return taken
+
+    def food_window(self, x: int, y: int, radius: int = 1) -> np.ndarray:
+        """Return the square block of food centred on ``(x, y)``.
+
+        Cells beyond the grid edge read as zero food, so the block is
+        always ``2 * radius + 1`` wide and needs no bounds handling.
+
+        Args:
+            x: Column index.
+            y: Row index.
+            radius: Half-width of the block, from 0 to 2.
+
+        Returns:
+            A read-only view of shape ``(2 * radius + 1, 2 * radius + 1)``.
 
-    def cell_at(self, x: int, y: int) -> Cell:
+        Raises:
+            IndexError: If ``(x, y)`` is outside the grid.
+            ValueError: If ``radius`` is negative or wider than the halo.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            msg = f"({x}, {y}) out of bounds for {self.width}x{self.height}"
+            raise IndexError(msg)
+        if not 0 <= radius <= _HALO:
+            msg = f"radius must be between 0 and {_HALO}, got {radius}"
+            raise ValueError(msg)
+        y0 = y + _HALO - radius
+        x0 = x + _HALO - radius
+        window = self._food_padded[y0 : y0 + 2 * radius + 1, x0 : x0 + 2 * radius + 1]
+        window.flags.writeable = False
+        return window
+
+    def cell_at(self, x: int, y: int) -> CellView:
         """Return the cell at grid coordinates ``(x, y)``.
 
         Args:
@@ -49,7 +257,7 @@ class World:
         if not (0 <= x < self.width and 0 <= y < self.height):
             msg = f"({x}, {y}) out of bounds for {self.width}x{self.height}"
             raise IndexError(msg)
-        return self.cells[y][x]
+        return self.flat_cells[y * self.width + x]
 
     def neighbours(
         self,
@@ -57,27 +265,103 @@ class World:
         y: int,
         *,
         include_diagonals: bool = True,
-    ) -> list[Cell]:
+    ) -> tuple[CellView, ...]:
         """Return adjacent cells for the given position.
 
+        Dispatches to ``neighbours8`` or ``neighbours4`` for in-bounds
+        positions; hot callers with in-bounds positions should call those
+        directly.  Off-grid positions fall back to a bounds-checked
+        lookup, so they still get the in-bounds cells adjacent to them.
+
         Args:
             x: Column index.
             y: Row index.
             include_diagonals: If True, return up to 8 neighbours; otherwise 4.
 
         Returns:
-            List of neighbouring Cell objects (excludes out-of-bounds).
+            Tuple of neighbouring CellView handles (excludes out-of-bounds).
         """
-        offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            offsets = _OFFSETS_8 if include_diagonals else _OFFSETS_4
+            return self._clipped_neighbours(x, y, offsets)
         if include_diagonals:
-            offsets += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+            return self.neighbours8(x, y)
+        return self.neighbours4(x, y)
+
+    def neighbours4(self, x: int, y: int) -> tuple[CellView, ...]:
+        """Return the up-to-4 cardinal neighbours of in-bounds ``(x, y)``.
+
+        Same order as ``_OFFSETS_4``: west, east, north, south.
+        """
+        if self._nbr4 is None:
+            self._nbr4 = self._neighbour_table(_OFFSETS_4)
+        return self._nbr4[y * self.width + x]
+
+    def neighbours8(self, x: int, y: int) -> tuple[CellView, ...]:
+        """Return the up-to-8 surrounding neighbours of in-bounds ``(x, y)``.
+
+        Same order as ``_OFFSETS_8``: the four cardinals, then the
+        diagonals.
+        """
+        if self._nbr8 is None:
+            self._nbr8 = self._neighbour_table(_OFFSETS_8)
+        return self._nbr8[y * self.width + x]
+
+    def _clipped_neighbours(
+        self,
+        x: int,
+        y: int,
+        offsets: tuple[tuple[int, int], ...],
+    ) -> tuple[CellView, ...]:
+        """Bounds-checked neighbour lookup that works for any ``(x, y)``."""
+        w, h = self.width, self.height
+        flat = self.flat_cells
+        return tuple(
+            flat[(y + dy) * w + x + dx]
+            for dx, dy in offsets
+            if 0 <= x + dx < w and 0 <= y + dy < h
+        )
+
+    def _neighbour_table(
+        self,
+        offsets: tuple[tuple[int, int], ...],
+    ) -> list[tuple[CellView, ...]]:
+        """Build every cell's neighbour tuple, indexed ``[y * width + x]``.
+
+        The grid size is fixed for the world's lifetime, so bounds are
+        resolved once here and lookups are a single list index.
+        """
+        return [
+            self._clipped_neighbours(x, y, offsets)
+            for y in range(self.height)
+            for x in range(self.width)
+        ]
+
+    def neighbour_indices(
+        self,
+        x: int,
+        y: int,
+        *,
+        include_diagonals: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return in-bounds neighbour coordinates as index arrays.
+
+        The coordinates follow the same order as ``neighbours``, so
+        ``world.food[ys, xs]`` gathers neighbour values in one call.
 
-        result: list[Cell] = []
-        for dx, dy in offsets:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.width and 0 <= ny < self.height:
-                result.append(self.cells[ny][nx])
-        return result
+        Args:
+            x: Column index.
+            y: Row index.
+            include_diagonals: If True, return up to 8 neighbours; otherwise 4.
+
+        Returns:
+            ``(ys, xs)`` ``np.intp`` arrays of equal length.
+        """
+        n = 8 if include_diagonals else 4
+        xs = _DX_8[:n] + x
+        ys = _DY_8[:n] + y
+        in_bounds = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        return ys[in_bounds], xs[in_bounds]
 
     def populate(
         self,
@@ -99,22 +383,24 @@ class World:
             food_per_cell: (min, max) food placed per cell in a patch.
         """
         lo, hi = food_per_cell
-        for _ in range(num_patches):
-            cx = int(rng.integers(0, self.width))
-            cy = int(rng.integers(0, self.height))
-            for dy in range(-patch_radius, patch_radius + 1):
-                for dx in range(-patch_radius, patch_radius + 1):
-                    nx, ny = cx + dx, cy + dy
-                    if not (0 <= nx < self.width and 0 <= ny < self.height):
-                        continue
-                    # Circular falloff: cells near centre get more food
-                    dist = (dx * dx + dy * dy) ** 0.5
-                    if dist <= patch_radius:
-                        cell = self.cells[ny][nx]
-                        if not cell.is_nest:
-                            cell.food += float(
-                                rng.uniform(lo, hi) * (1.0 - dist / (patch_radius + 1)),
-                            )
+        r = patch_radius
+
+        kernel = _circle_kernel(r)
+
+        cxs = rng.integers(0, self.width, size=num_patches)
+        cys = rng.integers(0, self.height, size=num_patches)
+        # One draw for every patch; row i is the block patch i would have
+        # drawn on its own, so the stream matches a per-patch draw.
+        amounts = rng.uniform(lo, hi, (num_patches, *kernel.shape)) * kernel
+        for u, cx, cy in zip(amounts, cxs.tolist(), cys.tolist(), strict=True):
+            # Clip the patch to the grid, and the kernel to match
+            x0, x1 = max(0, cx - r), min(self.width, cx + r + 1)
+            y0, y1 = max(0, cy - r), min(self.height, cy + r + 1)
+            ks = (
+                slice(y0 - (cy - r), y1 - (cy - r)),
+                slice(x0 - (cx - r), x1 - (cx - r)),
+            )
+            self.food[y0:y1, x0:x1] += u[ks] * ~self.is_nest[y0:y1, x0:x1]
 
     def mark_nest(self, cx: int, cy: int, radius: int = 2) -> None:
         """Mark cells around ``(cx, cy)`` as nest territory.
@@ -124,12 +410,12 @@ class World:
             cy: Centre row of the nest.
             radius: How many cells outward to mark.
         """
-        for dy in range(-radius, radius + 1):
-            for dx in range(-radius, radius + 1):
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    self.cells[ny][nx].is_nest = True
-                    self.cells[ny][nx].food = 0.0
+        x0 = max(0, cx - radius)
+        x1 = max(x0, min(self.width, cx + radius + 1))
+        y0 = max(0, cy - radius)
+        y1 = max(y0, min(self.height, cy + radius + 1))
+        self.is_nest[y0:y1, x0:x1] = True
+        self.food[y0:y1, x0:x1] = 0.0
 
     def regenerate_food(
         self,
@@ -165,37 +451,40 @@ class World:
                 density (applied to density²).
             food_cap: Maximum food a cell can hold.
         """
-        # Snapshot current food to avoid order-dependent bias
-        food_snap = [[cell.food for cell in row] for row in self.cells]
-
-        for y, row in enumerate(self.cells):
-            for x, cell in enumerate(row):
-                if cell.is_nest or cell.food >= food_cap:
-                    continue
-
-                # Weighted food sum over 5x5 neighbourhood
-                weighted_food = 0.0
-                max_weight = 0.0
-                for dy in range(-2, 3):
-                    for dx in range(-2, 3):
-                        if dx == 0 and dy == 0:
-                            continue
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            # Inner ring (8-connected): weight 1.0
-                            # Outer ring: weight 0.5
-                            w = 1.0 if abs(dx) <= 1 and abs(dy) <= 1 else 0.5
-                            weighted_food += food_snap[ny][nx] * w
-                            max_weight += w * food_cap
-
-                # Normalised density 0..1
-                density = weighted_food / max_weight if max_weight > 0 else 0.0
-
-                # Quadratic scaling: dense patches grow fast,
-                # sparse edges barely grow
-                growth_prob = base_rate + spread_rate * density * density
-
-                if rng.random() < growth_prob:
-                    # Amount added also scales with density
-                    amount = float(rng.uniform(0.1, 0.3)) + 0.3 * density
-                    cell.food = min(food_cap, cell.food + amount)
+        food = self.food
+        shape = food.shape
+
+        # All neighbourhood sums read the pre-growth grid, so there is
+        # no order-dependent bias between cells.
+        weighted_food = _ring_weighted_sum(self._food_padded)
+        max_weight = self._ring_weight * food_cap
+
+        # Normalised density 0..1
+        density = np.divide(
+            weighted_food,
+            max_weight,
+            out=np.zeros(shape),
+            where=max_weight > 0,
+        )
+
+        eligible = ~self.is_nest & (food < food_cap)
+        grow = np.zeros(shape, dtype=np.bool_)
+
+        # Cells with food nearby: quadratic scaling, so dense patches grow
+        # fast and sparse edges barely grow.  One draw per such cell.
+        near = eligible & (density > 0)
+        near_density = density[near]
+        growth_prob = base_rate + spread_rate * near_density * near_density
+        grow[near] = rng.random(near_density.size) < growth_prob
+
+        # Everywhere else the probability is just base_rate, so sample the
+        # number of spontaneous sprouts and place only those.
+        quiet = np.flatnonzero(eligible & ~near)
+        k = int(rng.binomial(quiet.size, base_rate))
+        if k:
+            sprouts = rng.choice(quiet, size=k, replace=False)
+            grow[np.unravel_index(sprouts, shape)] = True
+
+        # Amount added also scales with density
+        amount = rng.uniform(0.1, 0.3, int(grow.sum())) + 0.3 * density[grow]
+        food[grow] = np.minimum(food_cap, food[grow] + amount)
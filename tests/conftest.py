@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import numpy as np
 import pytest
 from numpy.random import Generator
@@ -12,18 +14,37 @@ from anthemyr.simulation.config import SimulationConfig
 from anthemyr.world.world import World
 
 
-@pytest.fixture
-def rng() -> Generator:
-    """A deterministic random generator for reproducible tests."""
+@pytest.fixture(scope="session")
+def _rng_master() -> Generator:
+    """One seeded generator shared by the whole test session."""
     return np.random.default_rng(seed=12345)
 
 
 @pytest.fixture
-def small_world() -> World:
-    """A small 8x8 world for fast tests."""
+def rng(_rng_master: Generator) -> Iterator[Generator]:
+    """A deterministic random generator for reproducible tests.
+
+    Every test starts from the same seeded state; the state is rewound
+    afterwards so draws never leak between tests.
+    """
+    state = _rng_master.bit_generator.state
+    yield _rng_master
+    _rng_master.bit_generator.state = state
+
+
+@pytest.fixture(scope="module")
+def _module_world() -> World:
+    """One 8x8 world shared by every test in a module."""
     return World(width=8, height=8)
 
 
+@pytest.fixture
+def small_world(_module_world: World) -> World:
+    """A small 8x8 world for fast tests, reset to defaults for each test."""
+    _module_world.reset()
+    return _module_world
+
+
 @pytest.fixture
 def default_config() -> SimulationConfig:
     """Default simulation config (no YAML file needed)."""
@@ -43,3 +64,16 @@ def default_colony(rng: Generator) -> Colony:
 def small_pheromone_field() -> PheromoneField:
     """An 8x8 pheromone field for fast tests."""
     return PheromoneField(width=8, height=8)
+
+
+@pytest.fixture(scope="module")
+def _module_scratch_grid() -> np.ndarray:
+    """One 8x8 float32 buffer shared by every test in a module."""
+    return np.empty((8, 8), dtype=np.float32)
+
+
+@pytest.fixture
+def scratch_grid(_module_scratch_grid: np.ndarray) -> np.ndarray:
+    """A zeroed 8x8 float32 grid, reusing the module's buffer."""
+    _module_scratch_grid.fill(0.0)
+    return _module_scratch_grid
@@ -1,10 +1,15 @@
 """Tests for anthemyr.colony - Colony, Ant, Traits, Policies."""
 
+import dataclasses
+
+import numpy as np
+import pytest
 from numpy.random import Generator
 
-from anthemyr.colony.ant import Ant, Task
+from anthemyr.colony.ant import ANT_DTYPE, Ant, Task
 from anthemyr.colony.colony import Colony
 from anthemyr.colony.policies import Policies
+from anthemyr.colony.population import AntPopulation
 from anthemyr.colony.traits import Traits
 from anthemyr.pheromones.fields import PheromoneField, PheromoneType
 from anthemyr.world.world import World
@@ -44,6 +49,12 @@ class TestAnt:
         assert "brood" in ant.thresholds
         assert "waste" in ant.thresholds
 
+    def test_thresholds_write_through(self, rng: Generator) -> None:
+        ant = Ant.from_traits(x=0, y=0, traits=Traits(), rng=rng)
+        ant.thresholds["food"] = 0.25
+        assert ant.threshold_food == 0.25
+        assert dict(ant.thresholds)["food"] == 0.25
+
     def test_default_state(self, rng: Generator) -> None:
         ant = Ant.from_traits(x=0, y=0, traits=Traits(), rng=rng)
         assert ant.task == Task.FORAGING
@@ -54,6 +65,20 @@ class TestAnt:
         ant = Ant(x=0, y=0, hp=0.0)
         assert not ant.is_alive
 
+    def test_equality_and_repr_include_vitals(self) -> None:
+        ant = Ant(x=1, y=2, hp=0.5, age=3)
+        assert ant == Ant(x=1, y=2, hp=0.5, age=3)
+        assert ant != Ant(x=1, y=2, hp=1.0, age=3)
+        assert ant != Ant(x=1, y=2, hp=0.5, age=99)
+        assert "hp=0.5, age=3" in repr(ant)
+
+    def test_replace_keeps_vitals_in_own_row(self) -> None:
+        ant = Ant(x=1, y=2, hp=0.5, age=3)
+        moved = dataclasses.replace(ant, x=5)
+        assert (moved.x, moved.y, moved.hp, moved.age) == (5, 2, 0.5, 3)
+        moved.hp = 0.0
+        assert ant.hp == 0.5
+
 
 class TestColony:
     """Tests for Colony aggregate state."""
@@ -71,6 +96,16 @@ class TestColony:
         expected = initial - len(default_colony.ants) * 1.0
         assert default_colony.food_stores == expected
 
+    def test_update_ants_banks_delivered_food(self, rng: Generator) -> None:
+        world = World(width=8, height=8)
+        world.mark_nest(4, 4, radius=1)
+        phero = PheromoneField(width=8, height=8)
+        colony = Colony(colony_id=0, nest_x=4, nest_y=4, food_stores=10.0)
+        colony.ants.append(Ant(x=4, y=4, task=Task.CARRYING_FOOD, carrying_food=2.0))
+        delivered = colony.update_ants(world, phero, rng)
+        assert delivered == 2.0
+        assert colony.food_stores == 12.0
+
 
 class TestAntForaging:
     """Tests for ant foraging behaviour."""
@@ -153,9 +188,12 @@ class TestAntForaging:
     def test_ant_ages_each_tick(self, rng: Generator) -> None:
         world = World(width=8, height=8)
         phero = PheromoneField(width=8, height=8)
+        colony = Colony(colony_id=0, nest_x=4, nest_y=4)
         ant = Ant(x=4, y=4)
-        ant.update(world, phero, 4, 4, rng)
-        assert ant.age == 1
+        colony.ants.append(ant)
+        colony.update_ants(world, phero, rng)
+        colony.update_ants(world, phero, rng)
+        assert ant.age == 2
 
     def test_remove_dead(self, default_colony: Colony) -> None:
         # Kill two ants
@@ -166,6 +204,66 @@ class TestAntForaging:
         assert all(not a.is_alive for a in dead)
         assert all(a.is_alive for a in default_colony.ants)
 
+    def test_remove_dead_keeps_columns_aligned(self, default_colony: Colony) -> None:
+        ants = default_colony.ants
+        for i, ant in enumerate(ants):
+            ant.age = 10 * i
+        ants[1].hp = 0.0
+        dead = default_colony.remove_dead()
+        assert dead[0].age == 10
+        assert [a.age for a in ants] == [0, 20, 30, 40]
+        assert ants.age.tolist() == [0, 20, 30, 40]
+
+    def test_appended_ant_joins_columns(self) -> None:
+        colony = Colony(colony_id=0, nest_x=4, nest_y=4)
+        ant = Ant(x=1, y=1, hp=0.7, age=5)
+        colony.ants.append(ant)
+        colony.apply_aging(max_age=5)
+        assert ant.hp == 0.0
+        assert colony.ants.hp.tolist() == [0.0]
+        assert colony.ants.records.dtype == ANT_DTYPE
+
+    def test_population_grows_past_initial_capacity(self) -> None:
+        colony = Colony(colony_id=0, nest_x=4, nest_y=4)
+        for i in range(200):
+            colony.ants.append(Ant(x=0, y=0, age=i))
+        assert len(colony.ants) == 200
+        assert colony.ants.age.tolist() == list(range(200))
+        assert colony.ants[150].age == 150
+
+    def test_colony_adopts_list_of_ants(self) -> None:
+        colony = Colony(
+            colony_id=0,
+            nest_x=4,
+            nest_y=4,
+            food_stores=0.0,
+            ants=[Ant(x=1, y=1, hp=1.0), Ant(x=2, y=2, hp=0.0)],
+        )
+        assert isinstance(colony.ants, AntPopulation)
+        colony.apply_food_pressure(1.0, 0.5)
+        assert colony.ants.hp.tolist() == [0.5, -0.5]
+        dead = colony.remove_dead()
+        assert [(a.x, a.y) for a in dead] == [(2, 2)]
+        assert len(colony.ants) == 1
+
+    def test_append_rejects_ant_in_another_population(self) -> None:
+        ant = Ant(x=0, y=0)
+        first = Colony(colony_id=0, nest_x=4, nest_y=4)
+        first.ants.append(ant)
+        second = Colony(colony_id=1, nest_x=4, nest_y=4)
+        with pytest.raises(ValueError, match="already belongs"):
+            second.ants.append(ant)
+        assert len(second.ants) == 0
+
+    def test_positions_gather_in_row_order(self) -> None:
+        colony = Colony(colony_id=0, nest_x=4, nest_y=4)
+        for i in range(3):
+            colony.ants.append(Ant(x=i, y=10 - i))
+        xs, ys = colony.ants.positions()
+        assert xs.tolist() == [0, 1, 2]
+        assert ys.tolist() == [10, 9, 8]
+        assert xs.dtype == np.int32
+
 
 class TestGathering:
     """Tests for the GATHERING task mode."""
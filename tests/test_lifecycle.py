@@ -169,10 +169,8 @@ class TestFoodRegeneration:
         """Food grows outward from cells that already have food."""
         world = World(width=8, height=8)
         # Seed a 3x3 cluster so the centre has full inner-ring density
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                world.cell_at(4 + dx, 4 + dy).food = 5.0
-        total_before = sum(c.food for row in world.cells for c in row)
+        world.food[3:6, 3:6] = 5.0
+        total_before = world.food.sum()
         for _ in range(100):
             world.regenerate_food(
                 rng,
@@ -180,7 +178,7 @@ class TestFoodRegeneration:
                 spread_rate=1.0,
                 food_cap=5.0,
             )
-        total_after = sum(c.food for row in world.cells for c in row)
+        total_after = world.food.sum()
         assert total_after > total_before
         # Edge neighbour of cluster should have food
         assert world.cell_at(2, 4).food > 0 or world.cell_at(6, 4).food > 0
@@ -195,16 +193,14 @@ class TestFoodRegeneration:
                 spread_rate=0.5,
                 food_cap=5.0,
             )
-        total = sum(c.food for row in world.cells for c in row)
+        total = world.food.sum()
         assert total == 0.0
 
     def test_food_respects_cap(self, rng: Generator) -> None:
         """Food never exceeds the configured cap."""
         world = World(width=4, height=4)
         # Seed all cells so spread is active
-        for row in world.cells:
-            for cell in row:
-                cell.food = 3.0
+        world.food[:] = 3.0
         for _ in range(1000):
             world.regenerate_food(
                 rng,
@@ -212,9 +208,7 @@ class TestFoodRegeneration:
                 spread_rate=1.0,
                 food_cap=3.0,
             )
-        for row in world.cells:
-            for cell in row:
-                assert cell.food <= 3.0
+        assert world.food.max() <= 3.0
 
     def test_nest_cells_dont_regen(self, rng: Generator) -> None:
         """Nest cells should not accumulate food."""
@@ -243,7 +237,7 @@ class TestFoodRegeneration:
                 spread_rate=0.0,
                 food_cap=5.0,
             )
-        total = sum(c.food for row in world.cells for c in row)
+        total = world.food.sum()
         assert total > 0
 
 
@@ -317,6 +311,21 @@ class TestBroodDevelopment:
             colony.develop_brood(mature_ticks=10, rng=rng)
         assert colony.brood_count == 0
 
+    def test_several_brood_hatch_in_one_tick(self, rng: Generator) -> None:
+        """Progress covering several maturations hatches them all at once."""
+        colony = Colony(
+            colony_id=0,
+            nest_x=4,
+            nest_y=4,
+            brood_count=5,
+            brood_progress=2,
+        )
+        hatched = colony.develop_brood(mature_ticks=3, rng=rng)
+        assert hatched == 2
+        assert colony.brood_count == 3
+        assert colony.brood_progress == 1
+        assert len(colony.ants) == 2
+
     def test_no_brood_no_hatch(self, rng: Generator) -> None:
         """No brood means no new ants."""
         colony = Colony(
@@ -361,6 +370,16 @@ class TestBroodDevelopment:
         assert colony.generation == 0  # no evolution yet
 
 
+def _run_lifecycle(cfg: SimulationConfig) -> tuple[object, ...]:
+    """Run 50 ticks with one colony and snapshot the colony state."""
+    engine = SimulationEngine(config=cfg)
+    colony = Colony(colony_id=0, nest_x=4, nest_y=4)
+    engine.add_colony(colony)
+    engine.run(ticks=50)
+    ants = [(a.x, a.y, a.task, a.hp, a.age) for a in colony.ants]
+    return colony.food_stores, colony.brood_count, ants
+
+
 class TestLifecycleDeterminism:
     """Ensure lifecycle features preserve determinism."""
 
@@ -381,27 +400,4 @@ class TestLifecycleDeterminism:
             brood_mature_ticks=30,
         )
 
-        engine_a = SimulationEngine(config=cfg)
-        colony_a = Colony(colony_id=0, nest_x=4, nest_y=4)
-        engine_a.add_colony(colony_a)
-        engine_a.run(ticks=50)
-
-        engine_b = SimulationEngine(config=cfg)
-        colony_b = Colony(colony_id=0, nest_x=4, nest_y=4)
-        engine_b.add_colony(colony_b)
-        engine_b.run(ticks=50)
-
-        assert len(colony_a.ants) == len(colony_b.ants)
-        assert colony_a.food_stores == colony_b.food_stores
-        assert colony_a.brood_count == colony_b.brood_count
-
-        for ant_a, ant_b in zip(
-            colony_a.ants,
-            colony_b.ants,
-            strict=True,
-        ):
-            assert ant_a.x == ant_b.x
-            assert ant_a.y == ant_b.y
-            assert ant_a.task == ant_b.task
-            assert ant_a.hp == ant_b.hp
-            assert ant_a.age == ant_b.age
+        assert _run_lifecycle(cfg) == _run_lifecycle(cfg)
@@ -2,12 +2,14 @@
 
 import numpy as np
 
-from anthemyr.pheromones.diffusion import diffuse, evaporate
+from anthemyr.pheromones.diffusion import diffuse, evaporate, update_field
 from anthemyr.pheromones.fields import (
+    LAYER_INDEX,
     PheromoneField,
     PheromoneLayer,
     PheromoneType,
 )
+from anthemyr.pheromones.kernels import evaporate_diffuse
 
 
 class TestPheromoneField:
@@ -22,7 +24,29 @@ class TestPheromoneField:
         small_pheromone_field: PheromoneField,
     ) -> None:
         for layer in small_pheromone_field.layers.values():
-            assert np.all(layer.grid == 0.0)
+            assert not layer.grid.any()
+
+    def test_layers_are_float32(self, small_pheromone_field: PheromoneField) -> None:
+        assert small_pheromone_field.grid.dtype == np.float32
+        layer = small_pheromone_field.get_layer(PheromoneType.TRAIL)
+        assert layer.dtype == np.float32
+
+    def test_tick_keeps_float32_views(
+        self,
+        small_pheromone_field: PheromoneField,
+    ) -> None:
+        field = small_pheromone_field
+        stack = field.grid
+        for ptype in PheromoneType:
+            field.deposit(ptype, x=4, y=4, amount=10.0)
+        field.deposit_many(PheromoneType.DEATH, [1, 2], [3, 3], amount=5.0)
+        for _ in range(5):
+            update_field(field)
+        assert field.grid is stack
+        assert field.grid.dtype == np.float32
+        for layer in field.layers.values():
+            assert layer.grid.dtype == np.float32
+            assert np.shares_memory(layer.grid, stack)
 
     def test_deposit_and_read(self, small_pheromone_field: PheromoneField) -> None:
         small_pheromone_field.deposit(PheromoneType.TRAIL, x=3, y=4, amount=1.5)
@@ -33,12 +57,32 @@ class TestPheromoneField:
         small_pheromone_field.deposit(PheromoneType.ALARM, x=1, y=1, amount=0.5)
         assert small_pheromone_field.read(PheromoneType.ALARM, x=1, y=1) == 1.5
 
+    def test_deposit_many_accumulates_repeats(
+        self,
+        small_pheromone_field: PheromoneField,
+    ) -> None:
+        field = small_pheromone_field
+        field.deposit_many(PheromoneType.DEATH, [1, 1, 6], [2, 2, 0], 5.0)
+        assert field.read(PheromoneType.DEATH, x=1, y=2) == 10.0
+        assert field.read(PheromoneType.DEATH, x=6, y=0) == 5.0
+
+    def test_layers_are_views_of_stack(
+        self,
+        small_pheromone_field: PheromoneField,
+    ) -> None:
+        field = small_pheromone_field
+        assert field.grid.shape == (len(PheromoneType), 8, 8)
+        field.deposit(PheromoneType.DEATH, x=2, y=5, amount=2.0)
+        assert field.grid[LAYER_INDEX[PheromoneType.DEATH], 5, 2] == 2.0
+        assert np.shares_memory(field.get_layer(PheromoneType.DEATH), field.grid)
+
 
 class TestEvaporation:
     """Tests for pheromone evaporation."""
 
-    def test_evaporation_reduces_concentration(self) -> None:
-        grid = np.ones((4, 4), dtype=np.float64)
+    def test_evaporation_reduces_concentration(self, scratch_grid: np.ndarray) -> None:
+        grid = scratch_grid
+        grid.fill(1.0)
         layer = PheromoneLayer(
             ptype=PheromoneType.TRAIL,
             grid=grid,
@@ -47,8 +91,9 @@ class TestEvaporation:
         evaporate(layer)
         assert np.allclose(layer.grid, 0.9)
 
-    def test_zero_evaporation(self) -> None:
-        grid = np.ones((4, 4), dtype=np.float64)
+    def test_zero_evaporation(self, scratch_grid: np.ndarray) -> None:
+        grid = scratch_grid
+        grid.fill(1.0)
         layer = PheromoneLayer(
             ptype=PheromoneType.TRAIL,
             grid=grid,
@@ -61,9 +106,9 @@ class TestEvaporation:
 class TestDiffusion:
     """Tests for pheromone diffusion."""
 
-    def test_total_concentration_conserved(self) -> None:
+    def test_total_concentration_conserved(self, scratch_grid: np.ndarray) -> None:
         """Diffusion should not create or destroy pheromone."""
-        grid = np.zeros((8, 8), dtype=np.float64)
+        grid = scratch_grid
         grid[4, 4] = 10.0
         total_before = grid.sum()
 
@@ -79,9 +124,9 @@ class TestDiffusion:
             f"Diffusion changed total: {total_before} -> {total_after}"
         )
 
-    def test_diffusion_spreads(self) -> None:
+    def test_diffusion_spreads(self, scratch_grid: np.ndarray) -> None:
         """After diffusion, neighbours of a point source should be non-zero."""
-        grid = np.zeros((8, 8), dtype=np.float64)
+        grid = scratch_grid
         grid[4, 4] = 10.0
         layer = PheromoneLayer(
             ptype=PheromoneType.ALARM,
@@ -98,8 +143,6 @@ class TestDiffusion:
 
     def test_trail_skips_diffusion(self) -> None:
         """TRAIL pheromone should not diffuse -- it evaporates in place."""
-        from anthemyr.pheromones.diffusion import update_field
-
         pf = PheromoneField(width=8, height=8)
         pf.deposit(PheromoneType.TRAIL, 4, 4, 10.0)
         update_field(pf)
@@ -108,3 +151,25 @@ class TestDiffusion:
         assert pf.read(PheromoneType.TRAIL, 5, 4) == 0.0
         # Centre should have evaporated but still be present
         assert 0 < pf.read(PheromoneType.TRAIL, 4, 4) < 10.0
+
+    def test_fused_kernel_matches_separate_passes(self) -> None:
+        rng = np.random.default_rng(3)
+        grid = rng.random((8, 8))
+        layer = PheromoneLayer(
+            ptype=PheromoneType.ALARM,
+            grid=grid.copy(),
+            diffusion_rate=0.2,
+            evaporation_rate=0.1,
+        )
+        evaporate(layer)
+        diffuse(layer)
+        evaporate_diffuse(grid, 0.1, 0.2)
+        assert np.allclose(grid, layer.grid, rtol=1e-12, atol=0.0)
+
+    def test_faint_concentrations_zeroed(self) -> None:
+        pf = PheromoneField(width=8, height=8)
+        pf.deposit(PheromoneType.ALARM, 4, 4, 1e-35)
+        pf.deposit(PheromoneType.ALARM, 1, 1, 1.0)
+        update_field(pf)
+        assert pf.read(PheromoneType.ALARM, 4, 4) == 0.0
+        assert pf.read(PheromoneType.ALARM, 1, 1) > 0.0
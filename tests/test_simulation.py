@@ -1,8 +1,10 @@
 """Tests for anthemyr.simulation — engine and config loading."""
 
+import dataclasses
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from anthemyr.colony.colony import Colony
 from anthemyr.simulation.config import SimulationConfig
@@ -18,6 +20,14 @@ class TestSimulationConfig:
         assert cfg.world_width == 64
         assert cfg.world_height == 64
 
+    def test_config_is_frozen_and_hashable(self) -> None:
+        cfg = SimulationConfig(pheromone_defaults={"trail": {"evaporation": 0.1}})
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.seed = 1
+        same = SimulationConfig(pheromone_defaults={"trail": {"evaporation": 0.1}})
+        assert cfg == same
+        assert len({cfg, same, dataclasses.replace(cfg, seed=1)}) == 2
+
     def test_from_yaml(self, tmp_path: Path) -> None:
         yaml_file = tmp_path / "test.yaml"
         yaml_file.write_text("seed: 99\nworld_width: 16\nworld_height: 16\n")
@@ -25,6 +35,22 @@ class TestSimulationConfig:
         assert cfg.seed == 99
         assert cfg.world_width == 16
 
+    def test_from_yaml_reloads_changed_file(self, tmp_path: Path) -> None:
+        yaml_file = tmp_path / "test.yaml"
+        yaml_file.write_text("seed: 1\n")
+        assert SimulationConfig.from_yaml(yaml_file).seed == 1
+        yaml_file.write_text("seed: 200\n")
+        assert SimulationConfig.from_yaml(yaml_file).seed == 200
+
+    def test_from_yaml_returns_independent_copies(self, tmp_path: Path) -> None:
+        yaml_file = tmp_path / "test.yaml"
+        yaml_file.write_text("pheromone_defaults:\n  trail:\n    evaporation: 0.1\n")
+        first = SimulationConfig.from_yaml(yaml_file)
+        first.pheromone_defaults["trail"]["evaporation"] = 0.9
+        second = SimulationConfig.from_yaml(yaml_file)
+        assert second is not first
+        assert second.pheromone_defaults["trail"]["evaporation"] == 0.1
+
 
 class TestSimulationEngine:
     """Tests for the tick loop."""
@@ -44,6 +70,30 @@ class TestSimulationEngine:
         engine.run(ticks=10)
         assert engine.tick == 10
 
+    def test_pheromone_layers_updated_in_place(
+        self,
+        default_config: SimulationConfig,
+    ) -> None:
+        engine = SimulationEngine(config=default_config)
+        engine.add_colony(Colony(colony_id=0, nest_x=10, nest_y=10))
+        field = engine.pheromone_field
+        before = {ptype: field.get_layer(ptype) for ptype in field.layers}
+        engine.run(ticks=5)
+        for ptype, grid in before.items():
+            assert field.get_layer(ptype) is grid
+
+    def test_restore_rng_replays_draws(
+        self,
+        default_config: SimulationConfig,
+    ) -> None:
+        engine = SimulationEngine(config=default_config)
+        engine.run(ticks=3)
+        snapshot = engine.snapshot_rng()
+        first = engine.rng.random(4)
+        engine.run(ticks=2)
+        engine.restore_rng(snapshot)
+        assert np.array_equal(engine.rng.random(4), first)
+
     def test_determinism(self) -> None:
         """Same seed must produce identical state after N ticks."""
         cfg = SimulationConfig(
@@ -63,6 +113,9 @@ class TestSimulationEngine:
         engine_b.add_colony(colony_b)
         engine_b.run(ticks=20)
 
+        # Both runs must have consumed exactly the same random draws
+        assert engine_a.snapshot_rng() == engine_b.snapshot_rng()
+
         # Environment state must match
         assert engine_a.environment.tick == engine_b.environment.tick
         assert engine_a.environment.time_of_day == engine_b.environment.time_of_day
@@ -74,12 +127,11 @@ class TestSimulationEngine:
                 engine_b.pheromone_field.get_layer(ptype),
             )
 
-        # Ant positions must match
-        for ant_a, ant_b in zip(
-            engine_a.colonies[0].ants,
-            engine_b.colonies[0].ants,
-            strict=True,
-        ):
-            assert ant_a.x == ant_b.x
-            assert ant_a.y == ant_b.y
-            assert ant_a.task == ant_b.task
+        # Ant positions and tasks must match
+        xs_a, ys_a = engine_a.colonies[0].ants.positions()
+        xs_b, ys_b = engine_b.colonies[0].ants.positions()
+        assert np.array_equal(xs_a, xs_b)
+        assert np.array_equal(ys_a, ys_b)
+        assert [a.task for a in engine_a.colonies[0].ants] == [
+            b.task for b in engine_b.colonies[0].ants
+        ]
@@ -15,3 +15,56 @@ def test_main_module_importable() -> None:
     from anthemyr.__main__ import main
 
     assert callable(main)
+
+
+def test_compose_grid_layers() -> None:
+    """Grid composition paints nest, food, and trail without a display."""
+    import numpy as np
+
+    from anthemyr.ui.pygame_client import _compose_grid
+
+    food = np.zeros((4, 5))
+    food[1, 2] = 5.0
+    nest = np.zeros((4, 5), dtype=bool)
+    nest[3, 0] = True
+    trail = np.zeros((4, 5))
+    trail[0, 4] = 1.0
+
+    rgb = _compose_grid(food, nest, trail)
+    assert rgb.shape == (4, 5, 3)
+    assert rgb.dtype == np.uint8
+    assert rgb[0, 0].tolist() == [30, 20, 10]  # background
+    assert rgb[3, 0].tolist() == [80, 60, 40]  # nest
+    assert rgb[1, 2].tolist() == [50, 200, 30]  # full food, opaque over trail
+    assert rgb[0, 4, 2] > rgb[0, 0, 2]  # trail tints toward cyan
+
+
+def test_run_cleans_up_when_draw_raises(monkeypatch) -> None:
+    """A failing frame still drains the worker and shuts pygame down."""
+    import threading
+
+    import pygame
+    import pytest
+
+    from anthemyr.simulation.config import SimulationConfig
+    from anthemyr.simulation.engine import SimulationEngine
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    engine = SimulationEngine(config=SimulationConfig(world_width=8, world_height=8))
+    renderer = PygameRenderer(engine, cell_size=2)
+    finished = threading.Event()
+
+    def slow_frame() -> None:
+        threading.Event().wait(0.05)
+        finished.set()
+
+    def failing_draw() -> None:
+        renderer._pending = renderer._executor.submit(slow_frame)
+        raise RuntimeError("draw failed")
+
+    monkeypatch.setattr(renderer, "_draw", failing_draw)
+    with pytest.raises(RuntimeError, match="draw failed"):
+        renderer.run(fps=1000)
+    assert finished.is_set()
+    assert not pygame.get_init()
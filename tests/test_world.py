@@ -1,8 +1,11 @@
 """Tests for anthemyr.world.world and anthemyr.world.cell."""
 
+import numpy as np
+import pytest
 from numpy.random import Generator
 
 from anthemyr.world.cell import Cell, SoilType
+from anthemyr.world.environment import Environment
 from anthemyr.world.world import World
 
 
@@ -32,8 +35,6 @@ class TestWorld:
         assert cell.y == 5
 
     def test_cell_at_out_of_bounds(self, small_world: World) -> None:
-        import pytest
-
         with pytest.raises(IndexError):
             small_world.cell_at(8, 0)
 
@@ -54,13 +55,13 @@ class TestWorld:
     def test_populate_scatters_food(self, rng: Generator) -> None:
         world = World(width=16, height=16)
         world.populate(rng)
-        total_food = sum(c.food for row in world.cells for c in row)
+        total_food = world.food.sum()
         assert total_food > 0
 
     def test_populate_no_food_with_zero_patches(self, rng: Generator) -> None:
         world = World(width=8, height=8)
         world.populate(rng, num_patches=0)
-        total_food = sum(c.food for row in world.cells for c in row)
+        total_food = world.food.sum()
         assert total_food == 0.0
 
     def test_mark_nest(self, small_world: World) -> None:
@@ -70,3 +71,177 @@ class TestWorld:
         assert small_world.cell_at(5, 5).is_nest
         # Outside radius
         assert not small_world.cell_at(2, 2).is_nest
+
+    def test_food_array_matches_cells(self, rng: Generator) -> None:
+        world = World(width=16, height=16)
+        world.populate(rng)
+        expected = [[c.food for c in row] for row in world.cells]
+        assert np.array_equal(world.food, expected)
+
+    def test_food_is_float32(self, small_world: World) -> None:
+        assert small_world.food.dtype == np.float32
+        assert small_world.moisture.dtype == np.float32
+        assert small_world.temperature.dtype == np.float32
+        assert isinstance(small_world.take_food(0, 0, 1.0), float)
+
+    def test_take_food_limited_by_cell(self, small_world: World) -> None:
+        small_world.cell_at(2, 3).food = 4.0
+        assert small_world.take_food(2, 3, 3.0) == 3.0
+        assert small_world.take_food(2, 3, 3.0) == 1.0
+        assert small_world.food[3, 2] == 0.0
+
+    def test_mark_nest_sets_array(self, small_world: World) -> None:
+        assert not small_world.is_nest.any()
+        small_world.mark_nest(4, 4, radius=1)
+        assert small_world.is_nest.sum() == 9
+
+    def test_mark_nest_clips_at_edge(self, small_world: World) -> None:
+        small_world.cell_at(1, 1).food = 2.0
+        small_world.mark_nest(0, 0, radius=2)
+        assert small_world.is_nest.sum() == 9
+        assert small_world.is_nest[:3, :3].all()
+        assert small_world.food[:3, :3].sum() == 0.0
+
+    def test_mark_nest_fully_off_grid_marks_nothing(self, small_world: World) -> None:
+        small_world.mark_nest(-5, 3, radius=2)
+        small_world.mark_nest(3, -6)
+        assert not small_world.is_nest.any()
+
+    def test_worlds_compare_by_cell_state(self) -> None:
+        a, b = World(width=4, height=4), World(width=4, height=4)
+        assert a == b
+        b.cell_at(1, 2).food = 1.0
+        assert a != b
+        assert World(width=4, height=4) != World(width=4, height=5)
+
+    def test_reset_restores_defaults(self, small_world: World) -> None:
+        food = small_world.food
+        small_world.mark_nest(4, 4, radius=1)
+        small_world.food[0, 0] = 3.0
+        small_world.reset()
+        assert small_world.food is food
+        assert not small_world.food.any()
+        assert not small_world.is_nest.any()
+
+    def test_cell_view_writes_through(self, small_world: World) -> None:
+        cell = small_world.cell_at(1, 2)
+        cell.food = 2.5
+        cell.soil = SoilType.CLAY
+        assert small_world.food[2, 1] == 2.5
+        assert small_world.cell_at(1, 2).soil == SoilType.CLAY
+        assert small_world.cell_at(1, 2) is cell
+
+    def test_soil_mask_selects_cells(self, small_world: World) -> None:
+        small_world.cell_at(1, 2).soil = SoilType.ROCK
+        small_world.cell_at(5, 0).soil = SoilType.ROCK
+        rock = small_world.soil_mask(SoilType.ROCK)
+        assert rock.sum() == 2
+        assert rock[2, 1] and rock[0, 5]
+        assert small_world.soil_mask(SoilType.DIRT).sum() == 62
+        assert small_world.cell_at(1, 2).soil is SoilType.ROCK
+
+    def test_flat_cells_share_row_handles(self, small_world: World) -> None:
+        flat = small_world.flat_cells
+        assert len(flat) == 64
+        assert flat[3 * 8 + 5] is small_world.cells[3][5]
+        assert (flat[3 * 8 + 5].x, flat[3 * 8 + 5].y) == (5, 3)
+
+    def test_neighbour_table_matches_offsets(self, small_world: World) -> None:
+        for y in range(8):
+            for x in range(8):
+                for cells, diagonals in [
+                    (small_world.neighbours8(x, y), True),
+                    (small_world.neighbours4(x, y), False),
+                ]:
+                    ys, xs = small_world.neighbour_indices(
+                        x, y, include_diagonals=diagonals
+                    )
+                    assert [(c.x, c.y) for c in cells] == list(
+                        zip(xs.tolist(), ys.tolist(), strict=True)
+                    )
+
+    def test_neighbours_of_off_grid_position(self) -> None:
+        world = World(width=4, height=4)
+        left = world.neighbours(-1, 0)
+        assert sorted((c.x, c.y) for c in left) == [(0, 0), (0, 1)]
+        right = world.neighbours(4, 0, include_diagonals=False)
+        assert [(c.x, c.y) for c in right] == [(3, 0)]
+        assert world.neighbours(6, 0) == ()
+        below = world.neighbours(1, 4)
+        assert sorted((c.x, c.y) for c in below) == [(0, 3), (1, 3), (2, 3)]
+
+    def test_neighbour_indices_match_neighbours(self, small_world: World) -> None:
+        for x, y in [(0, 0), (4, 4), (7, 3)]:
+            ys, xs = small_world.neighbour_indices(x, y)
+            cells = small_world.neighbours(x, y)
+            assert ys.dtype == np.intp
+            assert list(zip(xs.tolist(), ys.tolist(), strict=True)) == [
+                (c.x, c.y) for c in cells
+            ]
+
+    def test_neighbour_indices_on_wide_grid(self) -> None:
+        world = World(width=40_000, height=1)
+        ys, xs = world.neighbour_indices(39_999, 0)
+        assert xs.tolist() == [39_998]
+        assert ys.tolist() == [0]
+
+    def test_food_window_reads_zero_past_edge(self, small_world: World) -> None:
+        small_world.food[:] = 1.0
+        corner = small_world.food_window(0, 0)
+        assert corner.shape == (3, 3)
+        assert corner.sum() == 4.0
+
+    def test_food_window_rejects_bad_radius(self, small_world: World) -> None:
+        assert small_world.food_window(4, 4, radius=2).shape == (5, 5)
+        for radius in (-1, 3):
+            with pytest.raises(ValueError, match="radius"):
+                small_world.food_window(4, 4, radius=radius)
+
+    def test_food_window_rejects_off_grid_centre(self, small_world: World) -> None:
+        for x, y in ((-4, 0), (0, -1), (8, 0), (0, 8)):
+            with pytest.raises(IndexError):
+                small_world.food_window(x, y)
+
+
+class TestEnvironment:
+    """Tests for the global Environment state."""
+
+    def test_day_length_change_takes_effect(
+        self,
+        small_world: World,
+        rng: Generator,
+    ) -> None:
+        env = Environment(day_length=4, weather_enabled=False)
+        env.day_length = 8
+        for _ in range(2):
+            env.update(small_world, rng)
+        assert env.time_of_day == 0.25
+
+    def test_time_of_day_wraps(self, small_world: World, rng: Generator) -> None:
+        env = Environment(day_length=4)
+        for _ in range(6):
+            env.update(small_world, rng)
+        assert env.time_of_day == 0.5
+        assert env.is_daytime
+
+    def test_disabled_weather_draws_no_randoms(self, small_world: World) -> None:
+        rng = np.random.default_rng(1)
+        state = rng.bit_generator.state
+        env = Environment(weather_enabled=False)
+        for _ in range(10):
+            env.update(small_world, rng)
+        assert rng.bit_generator.state == state
+        assert env.rain_intensity == 0.0
+
+    def test_rain_tapers_off_after_weather_disabled(
+        self,
+        small_world: World,
+        rng: Generator,
+    ) -> None:
+        env = Environment(rain_intensity=0.5)
+        env.weather_enabled = False
+        env.update(small_world, rng)
+        assert env.rain_intensity == pytest.approx(0.45)
+        for _ in range(10):
+            env.update(small_world, rng)
+        assert env.rain_intensity == 0.0